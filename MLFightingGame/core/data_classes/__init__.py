@@ -10,6 +10,7 @@ from .player_inventory import PlayerInventory
 from .player_state import PlayerState
 from .purchase import Purchase
 from .shop_item import ShopItem
+from .stat_modifiers import StatModifiers
 from .weapon import Weapon
 
 __all__ = ['ActionFrameData', 
@@ -23,5 +24,6 @@ __all__ = ['ActionFrameData',
            'PlayerState', 
            'PlayerInventory', 
            'ShopItem',
+           'StatModifiers',
            'Purchase', 
            'Weapon']
\ No newline at end of file
@@ -23,5 +23,6 @@ class FightContext:
     end_time: Optional[datetime] = None
     winner: Optional[int] = None  # 1, 2, or 0 for draw
     total_frames: int = 0
-    replay_data: Optional[Dict[str, Any]] = None
+    replay_data: Optional[bytes] = None  # Serialized replay, see ReplayRecorder.from_bytes
+    replay_summary: Optional[Dict[str, Any]] = None  # See ReplayRecorder.summary
     error_message: Optional[str] = None
@@ -1,5 +1,6 @@
-from dataclasses import dataclass
-from typing import Dict, Optional
+from dataclasses import dataclass, fields, replace
+from typing import ClassVar, Dict, Optional, Tuple
+import numpy as np
 from .weapon import Weapon
 from .armour import Armour
 from .fighter_frame_data import FighterFrameData
@@ -7,7 +8,7 @@ from .action_frame_data import ActionFrameData
 from ..globals import Action
 
 
-@dataclass
+@dataclass(slots=True)
 class Fighter:
     """Represents the structure of a character with stats and frame data"""
     name: str
@@ -32,10 +33,49 @@ class Fighter:
     armour: Optional[Armour] = None
     frame_data: Optional[FighterFrameData] = None
     
+    # Numeric stats that items can modify, in stat-vector order
+    STAT_FIELDS: ClassVar[Tuple[str, ...]] = (
+        'gravity', 'jump_force', 'move_speed', 'x_attack_range', 'y_attack_range',
+        'attack_damage', 'attack_cooldown', 'on_hit_stun', 'on_block_stun',
+        'health', 'damage_reduction'
+    )
+    STAT_INDEX: ClassVar[Dict[str, int]] = {name: i for i, name in enumerate(STAT_FIELDS)}
+    
+    def stat_vector(self) -> np.ndarray:
+        """Modifiable stats as a float64 vector ordered like STAT_FIELDS"""
+        return np.array([getattr(self, name) for name in self.STAT_FIELDS], dtype=np.float64)
+    
+    def with_stats(self, stats: np.ndarray, **changes) -> 'Fighter':
+        """
+        Copy of this fighter with STAT_FIELDS taken from a stat vector
+        
+        Stats that are ints on this fighter stay ints. Any extra keyword
+        arguments are passed through to dataclasses.replace.
+        """
+        changes.update(self._stat_values(stats))
+        return replace(self, **changes)
+    
+    def _stat_values(self, stats: np.ndarray) -> Dict:
+        """Map a stat vector back to field values, rounding the fields declared as int"""
+        values = {}
+        for name, value in zip(self.STAT_FIELDS, stats.tolist()):
+            values[name] = int(round(value)) if name in _INT_FIELDS else value
+        return values
+    
+    @property
+    def frame_data_table(self) -> Tuple[Tuple[int, int, int], ...]:
+        """Per-action (startup, active, recovery) frames, indexed by Action value"""
+        return self.frame_data.frame_table
+    
     def get_action_data(self, action: Action) -> ActionFrameData:
         """Get frame data for a specific action"""
         return self.frame_data.get_action_data(action)
     
     def get_total_frames(self, action: Action) -> int:
         """Get total frames for an action"""
-        return self.get_action_data(action).total_frames
\ No newline at end of file
+        return self.get_action_data(action).total_frames
+
+
+# Fields annotated as int, rounded when rebuilt from a stat vector. Decided by
+# the declaration, not the loaded value, so "gravity": 1 in a config stays a float stat
+_INT_FIELDS = frozenset(f.name for f in fields(Fighter) if f.type is int)
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
-from typing import Dict, ClassVar
+from functools import cached_property
+from typing import Dict, ClassVar, Tuple
 from ..globals.actions import Action
 from .action_frame_data import ActionFrameData
 
@@ -12,6 +13,24 @@ class FighterFrameData:
         """Get frame data for a specific action"""
         return self.actions.get(action, self._get_default_action_data(action))
     
+    @cached_property
+    def frame_table(self) -> Tuple[Tuple[int, int, int], ...]:
+        """
+        (startup, active, recovery) frames for every action, indexed by Action value
+
+        Built on first use and shared by every PlayerState spawned from this
+        frame data, so it must never be mutated.
+        """
+        table = []
+        for action in Action:
+            action_data = self.get_action_data(action)
+            table.append((
+                action_data.startup_frames,
+                action_data.active_frames,
+                action_data.recovery_frames
+            ))
+        return tuple(table)
+    
     def _get_default_action_data(self, action: Action) -> ActionFrameData:
         """Get default frame data for an action"""
         if action == Action.ATTACK:
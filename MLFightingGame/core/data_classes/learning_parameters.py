@@ -5,9 +5,13 @@ import copy
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class LearningParameters:
-    """Learning parameters for the ML agent"""
+    """
+    Learning parameters for the ML agent
+
+    Slotted: epsilon is read and written on every action.
+    """
     epsilon: float = 1.0
     epsilon_decay: float = 0.995
     epsilon_min: float = 0.01
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field, asdict
-from typing import List, Dict, Set, Optional
+from typing import List, Dict, Set, Optional, Tuple
 from .weapon import Weapon
 from .armour import Armour
 
@@ -9,15 +9,25 @@ class PlayerInventory:
     weapons: List[Weapon] = field(default_factory=list)  # All owned weapons
     armour: List[Armour] = field(default_factory=list)   # All owned armour
     features: Set[str] = field(default_factory=set)      # Unlocked features (no duplicates)
+    feature_indices: Set[int] = field(default_factory=set)  # State vector indices of unlocked features
     reward_modifiers: Dict[str, List[Dict]] = field(default_factory=dict)
     learning_modifiers: Dict[str, List[Dict]] = field(default_factory=dict)
+    # Every learning modifier flattened to (category, delta), kept in step with learning_modifiers
+    learning_modifier_deltas: List[Tuple[str, float]] = field(init=False, repr=False, default_factory=list)
     
     # Remove these old fields
     # equipped_weapon_index: Optional[int] = None  # Index in weapons list
     # equipped_armour_index: Optional[int] = None  # Index in armour list
     
-    def add_weapon(self, weapon: Weapon):
-        """Add a weapon and auto-equip it (most recent)"""
+    def __post_init__(self):
+        self.learning_modifier_deltas = [
+            (category, modifier.get("delta", 0))
+            for category, modifiers in self.learning_modifiers.items()
+            for modifier in modifiers
+        ]
+    
+    def add_weapon(self, weapon: Weapon) -> bool:
+        """Add a weapon and auto-equip it (most recent); returns whether it is now equipped"""
         # Unequip all other weapons
         for w in self.weapons:
             w.equipped = False
@@ -25,9 +35,10 @@ class PlayerInventory:
         # Add new weapon as equipped
         weapon.equipped = True
         self.weapons.append(weapon)
+        return weapon.equipped
         
-    def add_armour(self, armour: Armour):
-        """Add armour and auto-equip it (most recent)"""
+    def add_armour(self, armour: Armour) -> bool:
+        """Add armour and auto-equip it (most recent); returns whether it is now equipped"""
         # Unequip all other armour
         for a in self.armour:
             a.equipped = False
@@ -35,6 +46,7 @@ class PlayerInventory:
         # Add new armour as equipped
         armour.equipped = True
         self.armour.append(armour)
+        return armour.equipped
         
     def get_equipped_weapon(self) -> Optional[Weapon]:
         """Get currently equipped weapon"""
@@ -72,9 +84,11 @@ class PlayerInventory:
             return True
         return False
     
-    def add_feature(self, feature_name: str):
+    def add_feature(self, feature_name: str, feature_index: Optional[int] = None):
         """Add a feature (only once)"""
         self.features.add(feature_name)
+        if feature_index is not None:
+            self.feature_indices.add(feature_index)
         
     def add_reward_modifier(self, category: str, modifier: Dict):
         """Add a reward modifier (stacks with existing)"""
@@ -87,6 +101,7 @@ class PlayerInventory:
         if category not in self.learning_modifiers:
             self.learning_modifiers[category] = []
         self.learning_modifiers[category].append(modifier)
+        self.learning_modifier_deltas.append((category, modifier.get("delta", 0)))
     
     def get_weapon_count(self) -> Dict[str, int]:
         """Get count of each weapon type"""
@@ -108,6 +123,7 @@ class PlayerInventory:
             "weapons": [asdict(w) for w in self.weapons],
             "armour": [asdict(a) for a in self.armour],
             "features": list(self.features),
+            "feature_indices": sorted(self.feature_indices),
             "reward_modifiers": self.reward_modifiers,
             "learning_modifiers": self.learning_modifiers,
             # No longer need equipped indices
@@ -1,5 +1,5 @@
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple, Any
 import numpy as np
 
@@ -7,9 +7,14 @@ from ..globals.actions import Action
 from ..globals.states import State
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerState:
-    """Represents the state of a player/fighter"""
+    """
+    Represents the state of a player/fighter
+
+    Slotted: fields live at fixed offsets instead of a per-instance __dict__,
+    so the engine's per-frame reads and writes skip the dict lookups.
+    """
     
     # Identity
     player_id: int = 0 # 1 or 2
@@ -45,7 +50,9 @@ class PlayerState:
     # Action state
     last_action_frame: int = 0 # Frame the last action was performed
     action_complete: bool = True # Whether the last action has completed (used for ML agents' rewards)
-    current_state: State = State.IDLE  # Current state of the player
+    # Current state of the player, stored as its plain int value for hot checks;
+    # read and write it as a State through the current_state property
+    current_state_value: int = State.IDLE.value
     state_frame_counter: int = 0 # Frames in current state
     
     # Status flags
@@ -64,21 +71,79 @@ class PlayerState:
     
     # Last action decision info
     last_action_state: Optional[np.ndarray] = None
-    last_action_choice: Optional[Action] = None
-    requested_action: Optional[Action] = None
+    last_action_choice: Optional[int] = None  # Raw action index from the agent
+    requested_action: Optional[int] = None
     accumulated_reward: float = 0.0 # Reward accumulated for the current action
     total_reward: float = 0.0 # Total reward accumulated for the player
 
-    frame_data: Dict[Action, List] = None
+    # (startup, active, recovery) per action, indexed by Action value; shared, never mutated
+    frame_data: Tuple[Tuple[int, int, int], ...] = None
+
+    # Cached reciprocals used to normalize the ML state vector
+    inv_max_health: float = field(init=False, repr=False, default=0.0)
+    inv_attack_cooldown: float = field(init=False, repr=False, default=0.0)
     
     def __post_init__(self):
+        self.refresh_inverses()
         if self.frame_data is None:
-            self.frame_data = {
-                Action.LEFT: [1, 10, 0],
-                Action.RIGHT: [1, 10, 0],
-                Action.JUMP: [10, 1, 20],
-                Action.BLOCK: [5, 25, 15],
-                Action.ATTACK: [10, 30, 20],
-                Action.IDLE: [0, 0, 0]
-            }
+            self.frame_data = _DEFAULT_FRAME_DATA
     
+
+    @property
+    def current_state(self) -> State:
+        """Current state of the player"""
+        return _STATES_BY_VALUE[self.current_state_value]
+
+    @current_state.setter
+    def current_state(self, state: State) -> None:
+        self.current_state_value = state.value
+
+    def set_current_state(self, state: State) -> None:
+        """Change state (same as assigning current_state)"""
+        self.current_state_value = state.value
+
+    def refresh_inverses(self) -> None:
+        """Recompute cached reciprocals; call after changing max_health or attack_cooldown"""
+        self.inv_max_health = 1.0 / self.max_health
+        self.inv_attack_cooldown = 1.0 / self.attack_cooldown
+
+    def fast_clone(self) -> 'PlayerState':
+        """Copy this state without deepcopy; frame_data is shared as it is never mutated"""
+        new = PlayerState.__new__(PlayerState)
+        for name in _SLOT_NAMES:
+            setattr(new, name, getattr(self, name))
+        if self.last_action_state is not None:
+            new.last_action_state = self.last_action_state.copy()
+        return new
+
+
+_SLOT_NAMES = PlayerState.__slots__
+
+_dataclass_init = PlayerState.__init__
+
+
+def _init_with_current_state(self, *args, current_state: Optional[State] = None, **kwargs):
+    """Dataclass __init__ that also accepts current_state as a State"""
+    _dataclass_init(self, *args, **kwargs)
+    if current_state is not None:
+        self.current_state_value = current_state.value
+
+
+# current_state is a property, not a field, so keep PlayerState(current_state=...) working
+PlayerState.__init__ = _init_with_current_state
+
+# State members indexed by value, for the current_state property
+_STATES_BY_VALUE = [None] * (max(state.value for state in State) + 1)
+for _state in State:
+    _STATES_BY_VALUE[_state.value] = _state
+_STATES_BY_VALUE = tuple(_STATES_BY_VALUE)
+
+# Frame data for states built without a fighter, indexed by Action value
+_DEFAULT_FRAME_DATA = (
+    (1, 10, 0),    # LEFT
+    (1, 10, 0),    # RIGHT
+    (10, 1, 20),   # JUMP
+    (5, 25, 15),   # BLOCK
+    (10, 30, 20),  # ATTACK
+    (0, 0, 0),     # IDLE
+)
@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+import numpy as np
+
+@dataclass(frozen=True)
+class StatModifiers:
+    """
+    Combined effect of a weapon and armour pairing on a fighter's stats
+    
+    Both vectors are ordered like Fighter.STAT_FIELDS; the modified stats are
+    base * mul + add. Instances are cached and shared, so the arrays are
+    read-only.
+    """
+    mul: np.ndarray
+    add: np.ndarray
+    
+    def apply(self, stats: np.ndarray) -> np.ndarray:
+        """Modified copy of a Fighter stat vector"""
+        return stats * self.mul + self.add
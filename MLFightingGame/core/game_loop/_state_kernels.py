@@ -0,0 +1,40 @@
+import numpy as np
+
+from ..globals.states import State
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional, fall back to plain Python
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+STATE_VECTOR_SIZE = 20
+
+# Plain ints so the kernel never touches the State enum
+JUMP_MASK = (1 << State.JUMP_ACTIVE.value) | (1 << State.JUMP_RISING.value) | (1 << State.JUMP_FALLING.value)
+BLOCK_ACTIVE = State.BLOCK_ACTIVE.value
+ATTACK_ACTIVE = State.ATTACK_ACTIVE.value
+
+
+# Explicit signature: compiled eagerly at import (or loaded from the on-disk cache)
+# instead of on the first frame, and called without dispatcher type checks
+@njit("f4[::1](f4[::1], f8[::1], f8[::1], f8[::1])", cache=True, fastmath=True)
+def build_state_vector(out, player_row, opponent_row, distance):
+    """
+    Write the normalized 20-feature state vector for a player into out
+
+    Rows are the player's and opponent's already normalized hot fields
+    (x, y, health, velocity_x, velocity_y, is_jumping, is_blocking,
+    is_attacking, attack_cooldown). distance holds the normalized x/y
+    distance between the players, which is the same for both vectors.
+    """
+    n = player_row.shape[0]
+    out[:n] = player_row
+    out[n:2 * n] = opponent_row
+    out[2 * n:] = distance
+    return out
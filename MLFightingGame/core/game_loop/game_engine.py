@@ -4,13 +4,17 @@ import logging
 from . import GameState
 from ..data_classes import PlayerState
 from ..players import Player
+from ..players._hitbox_kernels import boxes_overlap
 from ..rewards import RewardRegistry
 from ..globals.actions import Action
 from ..globals.states import State
-from ..replays import ReplayRecorder
+from ..replays import ReplayRecorder, ReplayArena
 
 logger = logging.getLogger(__name__)
 
+# States that keep their horizontal velocity instead of decelerating
+_NO_FRICTION_MASK = (1 << State.ATTACK_ACTIVE.value) | (1 << State.LEFT_ACTIVE.value) | (1 << State.RIGHT_ACTIVE.value)
+
 class GameEngine:
 
     def __init__(self,
@@ -30,6 +34,7 @@ class GameEngine:
         self.fight_over: bool = False 
         self.winner: int = 0
         self.replay_recorder: Optional[ReplayRecorder] = None
+        self.replay_arena: Optional[ReplayArena] = None
 
 
     def set_player(self, player_id: int, player: Player):
@@ -68,6 +73,15 @@ class GameEngine:
         self.is_recording = is_recording
         logger.debug(f"Recording set to: {is_recording}")
 
+    def set_replay_arena(self, arena: Optional[ReplayArena]):
+        """
+        Share a replay arena so recorded frames are allocated from it.
+        
+        Args:
+            arena: Arena owned by the caller, or None to allocate per replay
+        """
+        self.replay_arena = arena
+
 
     def step(self, game_state: GameState) -> GameState:
         """
@@ -84,6 +98,11 @@ class GameEngine:
         self.player_1.state = self.state.get_player(1)
         self.player_2.state = self.state.get_player(2)
 
+        # Both syncs are needed. This one picks up what changed since the last
+        # step's sync: the end-of-frame health/position clamps, a reset, or a new
+        # GameState. The one after the frame update feeds rewards and next states
+        self.state.sync_players()
+
         self._get_actions()
 
         self._apply_actions()
@@ -94,7 +113,11 @@ class GameEngine:
 
         self._update_frames()
 
-        self._check_game_over()
+        # KOs are detected as damage lands, so only the time limit needs a per-frame check
+        if not self.fight_over and self.frame_counter >= self.state.max_frames:
+            self._check_timeout()
+
+        self.state.sync_players()
         
         self._calculate_rewards()
 
@@ -140,11 +163,10 @@ class GameEngine:
         
         # Reset action states
         for player_state in [self.player_1.state, self.player_2.state]:
-            player_state.current_state = State.IDLE
+            player_state.set_current_state(State.IDLE)
             player_state.state_frame_counter = 0
             
             # Reset status flags
-            player_state.current_state = State.IDLE
             player_state.got_stunned = False
             
             # Reset total reward for this fight
@@ -168,21 +190,26 @@ class GameEngine:
                 state_vector = self.state.get_state_vector(player.state.player_id)
                 action = player.get_action(state_vector)
                 
-                # Store for potential commitment
+                # Store for potential commitment. The state vector is a reused
+                # buffer, so keep a private copy; while a decision is pending the
+                # copy is refreshed in place rather than reallocated every frame.
                 player.state.requested_action = action
-                player.state.last_action_state = state_vector
+                if player.state.last_action_state is None:
+                    player.state.last_action_state = state_vector.copy()
+                else:
+                    player.state.last_action_state[:] = state_vector
                 player.state.last_action_choice = action
 
     def _apply_actions(self):
         """Apply requested actions and update states using state machines"""
         for player in [self.player_1, self.player_2]:
             # Process requested actions
-            if hasattr(player.state, 'requested_action') and player.state.requested_action is not None:
+            if player.state.requested_action is not None:
                 action = player.state.requested_action
                 
                 if player.is_action_off_cooldown(action):
                     # Use state machine to check if transition is allowed
-                    if player.state_machine.can_transition(player.state.current_state, action):
+                    if player.state_machine.can_act(player.state.current_state_value, action):
                         # Get the new state from state machine
                         new_state = player.state_machine.get_next_state(player.state, player.state.current_state, action)
                         
@@ -192,40 +219,47 @@ class GameEngine:
                         player.state.action_complete = False
                 
                 # Clear requested action
-                delattr(player.state, 'requested_action')
+                player.state.requested_action = None
             
     def _update_physics(self):
         """Update physics for all players"""
-        for player_state in [self.player_1.state, self.player_2.state]:
+        arena_width = self.state.arena_width
+        ground_level = self.state.ground_level
+        for player_state in (self.player_1.state, self.player_2.state):
             # Apply gravity to all players (whether jumping or falling)
-            player_state.velocity_y += player_state.gravity
-            player_state.x += player_state.velocity_x
-            player_state.y += player_state.velocity_y
+            velocity_y = player_state.velocity_y + player_state.gravity
+            x = player_state.x + player_state.velocity_x
+            y = player_state.y + velocity_y
             
             # Boundary checking - account for player width (position is at center)
             half_width = player_state.width / 2
-            player_state.x = max(half_width, min(self.state.arena_width - half_width, player_state.x))
+            player_state.x = max(half_width, min(arena_width - half_width, x))
             
             # Ground collision - account for player height (position is at center)
             half_height = player_state.height / 2
-            if player_state.y + half_height > self.state.ground_level:
-                player_state.y = self.state.ground_level - half_height
-                player_state.velocity_y = 0
+            if y + half_height > ground_level:
+                y = ground_level - half_height
+                velocity_y = 0
                 player_state.is_grounded = True
             else:
                 player_state.is_grounded = False
+            player_state.y = y
+            player_state.velocity_y = velocity_y
             
             # Apply friction/deceleration for horizontal movement
-            if not player_state.current_state == State.ATTACK_ACTIVE and player_state.current_state not in [State.LEFT_ACTIVE, State.RIGHT_ACTIVE]:
+            if not (1 << player_state.current_state_value) & _NO_FRICTION_MASK:
                 player_state.velocity_x *= player_state.friction
     
     def _handle_combat(self):
         """Handle combat interactions between players"""
-        p1_attack_hitbox = self.player_1.get_attack_hitbox()
-        p2_attack_hitbox = self.player_2.get_attack_hitbox()
+        self.state.clear_frame_events()
+
+        p1_attack_hitbox = self.player_1.attack_hitbox_view()
+        p2_attack_hitbox = self.player_2.attack_hitbox_view()
         
-        p1_hitbox = self.player_1.get_hitbox()
-        p2_hitbox = self.player_2.get_hitbox()
+        # Most frames nobody is mid-attack, so skip the body hitboxes entirely
+        if p1_attack_hitbox is None and p2_attack_hitbox is None:
+            return
         
         p1_hits_p2 = False
         p2_hits_p1 = False
@@ -233,10 +267,11 @@ class GameEngine:
         player1_state = self.player_1.state
         player2_state = self.player_2.state
         
-        if p1_attack_hitbox:
-            p1_hits_p2 = self._hitboxes_overlap(p1_attack_hitbox, p2_hitbox) and player1_state.current_attack_landed == False
-        if p2_attack_hitbox:
-            p2_hits_p1 = self._hitboxes_overlap(p2_attack_hitbox, p1_hitbox) and player2_state.current_attack_landed == False
+        # Body hitboxes are only needed for the defender of an active attack
+        if p1_attack_hitbox is not None:
+            p1_hits_p2 = boxes_overlap(p1_attack_hitbox, self.player_2.hitbox_view()) and player1_state.current_attack_landed == False
+        if p2_attack_hitbox is not None:
+            p2_hits_p1 = boxes_overlap(p2_attack_hitbox, self.player_1.hitbox_view()) and player2_state.current_attack_landed == False
 
         if p1_hits_p2 and p2_hits_p1:
             # Both players hit - both get stunned
@@ -252,6 +287,9 @@ class GameEngine:
             player1_state.current_attack_landed = True
             player2_state.current_attack_landed = True
 
+            self.state.record_hit(1, 2)
+            self.state.record_hit(2, 1)
+
         elif p1_hits_p2:
             # Player 1 hits Player 2
             if player2_state.current_state == State.BLOCK_ACTIVE:
@@ -262,6 +300,7 @@ class GameEngine:
 
                 # Apply block damage reduction and base damage reduction
                 player2_state.health -= player1_state.attack_damage * (1 - player2_state.block_efficiency) * (1 - player2_state.damage_reduction)
+                self.state.record_block(1, 2)
             else:
                 # Player 2 does not block, so they take full damage and get stunned
                 player2_state.stun_frames_remaining = player1_state.on_hit_stun
@@ -270,6 +309,7 @@ class GameEngine:
 
                 # Player 2 takes damage equal to player 1's attack damage after their damage reduction is applied
                 player2_state.health -= player1_state.attack_damage * (1 - player2_state.damage_reduction)
+                self.state.record_hit(1, 2)
         elif p2_hits_p1:
             # Player 2 hits Player 1 and the same results occur but in reverse
             if player1_state.current_state == State.BLOCK_ACTIVE:
@@ -278,12 +318,17 @@ class GameEngine:
                 player2_state.current_attack_landed = True
 
                 player1_state.health -= player2_state.attack_damage * (1 - player1_state.block_efficiency) * (1 - player1_state.damage_reduction)
+                self.state.record_block(2, 1)
             else:
                 player1_state.stun_frames_remaining = player2_state.on_hit_stun
                 player1_state.got_stunned = True
                 player2_state.current_attack_landed = True
 
                 player1_state.health -= player2_state.attack_damage * (1 - player1_state.damage_reduction)
+                self.state.record_hit(2, 1)
+
+        if p1_hits_p2 or p2_hits_p1:
+            self._check_knockout()
 
     def _hitboxes_overlap(self, box1: Tuple[float, float, float, float], 
                         box2: Tuple[float, float, float, float]) -> bool:
@@ -295,62 +340,61 @@ class GameEngine:
 
     def _update_frames(self):
         """Update frame counters and handle action state transitions"""
-        if not hasattr(self, 'frame_counter'):
-            self.frame_counter = 0
         self.frame_counter += 1
         
-        for player in [self.player_1, self.player_2]:
+        for player in (self.player_1, self.player_2):
+            # Bound once; the state machine mutates this same object in place
+            player_state = player.state
 
-            if player.state.attack_cooldown_remaining > 0:
-                player.state.attack_cooldown_remaining -= 1
+            if player_state.attack_cooldown_remaining > 0:
+                player_state.attack_cooldown_remaining -= 1
             
-            if player.state.block_cooldown_remaining > 0:
-                player.state.block_cooldown_remaining -= 1
+            if player_state.block_cooldown_remaining > 0:
+                player_state.block_cooldown_remaining -= 1
 
-            if player.state.jump_cooldown_remaining > 0:
-                player.state.jump_cooldown_remaining -= 1
+            if player_state.jump_cooldown_remaining > 0:
+                player_state.jump_cooldown_remaining -= 1
             
-            if player.state.stun_frames_remaining > 0 and player.state.got_stunned == False:
-                player.state.stun_frames_remaining -= 1
+            if player_state.stun_frames_remaining > 0 and not player_state.got_stunned:
+                player_state.stun_frames_remaining -= 1
 
-            previous_state = player.state.current_state
+            previous_state = player_state.current_state
             # Check for automatic transitions (frame completion, physics events, combat events)
             player.update_state()
 
             # Reset the got stunned flag if the stun has been administered by the state machine
-            if player.state.got_stunned and player.state.current_state == State.STUNNED:
-                player.state.got_stunned = False
-            if player.state.current_state == State.IDLE and previous_state != State.IDLE:
-                player.state.action_complete = True
-                player.state.current_attack_landed = False
+            current_state = player_state.current_state
+            if player_state.got_stunned and current_state == State.STUNNED:
+                player_state.got_stunned = False
+            if current_state == State.IDLE and previous_state != State.IDLE:
+                player_state.action_complete = True
+                player_state.current_attack_landed = False
             
             # Increment state frame counter
-            player.state.state_frame_counter += 1
-
-
-    def _check_game_over(self) -> None:
-        """Check if game is over"""
-        # Game ends if time is up or a player has 0 health
-        if self.frame_counter >= self.state.max_frames:
-            self.fight_over = True
-            # Determine winner based on health
-            p1_health = self.player_1.state.health
-            p2_health = self.player_2.state.health
-            if p1_health > p2_health:
+            player_state.state_frame_counter += 1
+
+
+    def _check_timeout(self) -> None:
+        """End the fight on the time limit, deciding the winner by health"""
+        self.fight_over = True
+        # Determine winner based on health
+        p1_health = self.player_1.state.health
+        p2_health = self.player_2.state.health
+        if p1_health > p2_health:
+            self.winner = 1
+        elif p2_health > p1_health:
+            self.winner = 2
+        else:
+           # Tiebreak condition is whichever player is closer to the centre
+            p1_distance_from_center = abs(self.player_1.state.x - self.state.arena_width / 2)
+            p2_distance_from_center = abs(self.player_2.state.x - self.state.arena_width / 2)
+            if p1_distance_from_center < p2_distance_from_center:
                 self.winner = 1
-            elif p2_health > p1_health:
-                self.winner = 2
             else:
-               # Tiebreak condition is whichever player is closer to the centre
-                p1_distance_from_center = abs(self.player_1.state.x - self.state.arena_width / 2)
-                p2_distance_from_center = abs(self.player_2.state.x - self.state.arena_width / 2)
-                if p1_distance_from_center < p2_distance_from_center:
-                    self.winner = 1
-                else:
-                    self.winner = 2
+                self.winner = 2
 
-        
-        # Check for KO
+    def _check_knockout(self) -> None:
+        """End the fight if damage has taken a player's health to 0"""
         for player in [self.player_1.state, self.player_2.state]:
             player_id = player.player_id
             if player.health <= 0:
@@ -390,7 +434,7 @@ class GameEngine:
                     
                     player.update(
                         current_state, 
-                        player.state.last_action_choice.value, 
+                        player.state.last_action_choice, 
                         normalized_reward, 
                         next_state, 
                         self.fight_over
@@ -432,14 +476,14 @@ class GameEngine:
     def _initialize_recording(self):
         """Initialize the replay recorder"""
         self.replay_recorder = ReplayRecorder()
+        self.replay_recorder.bind_arena(self.replay_arena)
         self.replay_recorder.start_recording(self.state)
 
     def _record_frame(self):
         """Record the current frame's state"""
         # Initialize recorder on first frame if recording is enabled
         if self.is_recording and self.replay_recorder is None:
-            self.replay_recorder = ReplayRecorder()
-            self.replay_recorder.start_recording(self.state)
+            self._initialize_recording()
         
         # Record frame if recorder exists
         if self.replay_recorder is not None:
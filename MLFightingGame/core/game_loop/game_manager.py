@@ -3,10 +3,11 @@ import logging
 from typing import Dict, Optional, Tuple, Any
 from dataclasses import dataclass
 from datetime import datetime
+import numpy as np
 
 from ..game_loop import GameEngine, GameState
 from ..players import Player
-from ..replays import ReplayRecorder
+from ..replays import ReplayRecorder, ReplayArena
 from ..globals import FightStatus
 from ..globals.constants import ARENA_WIDTH, ARENA_HEIGHT, MAX_FRAMES
 from ..data_classes import FightContext
@@ -18,6 +19,8 @@ class GameManager:
     Manages multiple concurrent fights between players.
     Handles game engine lifecycle, fight execution, and result tracking.
     """
+
+    FRAMES_PER_YIELD = 10  # Frames stepped between cooperative yields to the event loop
     
     def __init__(self, 
                  arena_width: int = ARENA_WIDTH,
@@ -136,7 +139,7 @@ class GameManager:
         self.client_to_fight[client_1_id] = fight_id
         self.client_to_fight[client_2_id] = fight_id
         
-        logger.info(f"Created fight {fight_id}: {client_1_id} vs {client_2_id}")
+        logger.info("Created fight %s: %s vs %s", fight_id, client_1_id, client_2_id)
         
         return fight_id
     
@@ -166,60 +169,29 @@ class GameManager:
             raise RuntimeError(f"Fight {fight_id} is not in INITIALIZING state (current: {fight_context.status})")
         
         # ==================== FIGHT INITIALIZATION ====================
-        logger.info(f"Starting fight {fight_id}")
+        logger.info("Starting fight %s", fight_id)
         
         fight_context.status = FightStatus.IN_PROGRESS
         fight_context.start_time = datetime.now()
         
         game_engine = fight_context.game_engine
-        game_state = fight_context.game_state
         
         # ==================== MAIN FIGHT LOOP ====================
         try:
-            frame_count = 0
-            
-            while not game_engine.fight_over:
-                # ========== FRAME PROCESSING ==========
-                # Step the game engine forward one frame
-                game_state = game_engine.step(game_state)
-                frame_count += 1
-                fight_context.total_frames = frame_count
-                
-                # ========== ASYNC YIELD ==========
-                # Yield control periodically to prevent blocking other fights
-                if frame_count % 10 == 0:  # Every 10 frames
-                    await asyncio.sleep(0)
-            
-            # ==================== FIGHT COMPLETION ====================
-            # Mark fight as completed
-            fight_context.status = FightStatus.COMPLETED
-            fight_context.end_time = datetime.now()
-            fight_context.winner = game_engine.winner
-            
-            # ==================== REPLAY EXTRACTION ====================
-            # Extract replay data from the recorder
-            if game_engine.replay_recorder:
-                fight_context.replay_data = {
-                    "metadata": game_engine.replay_recorder.metadata,
-                    "frames": game_engine.replay_recorder.frames,
-                    "winner": game_engine.winner,
-                    "total_frames": frame_count
-                }
-                
-                # Save replay to file
-                replay_filepath = game_engine.replay_recorder.save_replay(game_engine.winner)
-                logger.info(f"Fight {fight_id} replay saved to {replay_filepath}")
-
-                # Clear the recorder after extracting data
-                game_engine.replay_recorder = None
+            # Most batch fights are not recorded, so they skip replay handling entirely
+            if game_engine.is_recording:
+                await self._run_fight_recording(fight_context)
+            else:
+                await self._run_fight_fast(fight_context)
             
             # ==================== STATISTICS UPDATE ====================
-            # Log fight completion statistics
-            duration = (fight_context.end_time - fight_context.start_time).total_seconds()
-            logger.info(f"Fight {fight_id} completed: "
-                       f"Winner=Player{fight_context.winner}, "
-                       f"Frames={frame_count}, "
-                       f"Duration={duration:.2f}s")
+            # Log fight completion statistics (skipped entirely when INFO is disabled)
+            if logger.isEnabledFor(logging.INFO):
+                duration = (fight_context.end_time - fight_context.start_time).total_seconds()
+                logger.info(f"Fight {fight_id} completed: "
+                           f"Winner=Player{fight_context.winner}, "
+                           f"Frames={fight_context.total_frames}, "
+                           f"Duration={duration:.2f}s")
             
             # ==================== CLEANUP ====================
             # Move fight to completed history
@@ -247,6 +219,57 @@ class GameManager:
             
             raise RuntimeError(f"Fight {fight_id} failed: {e}") from e
     
+    async def _run_fight_fast(self, fight_context: FightContext) -> None:
+        """
+        Step a fight to completion without any replay handling.
+        
+        Args:
+            fight_context: Context of the fight to run, already IN_PROGRESS
+        """
+        game_engine = fight_context.game_engine
+        game_state = fight_context.game_state
+        step = game_engine.step
+        frames_per_yield = range(self.FRAMES_PER_YIELD)
+        
+        while not game_engine.fight_over:
+            # Step the game engine forward a chunk of frames
+            for _ in frames_per_yield:
+                game_state = step(game_state)
+                if game_engine.fight_over:
+                    break
+            fight_context.total_frames = game_engine.frame_counter
+            
+            # Yield control between chunks to prevent blocking other fights
+            await asyncio.sleep(0)
+        
+        # Mark fight as completed
+        fight_context.status = FightStatus.COMPLETED
+        fight_context.end_time = datetime.now()
+        fight_context.winner = game_engine.winner
+    
+    async def _run_fight_recording(self, fight_context: FightContext) -> None:
+        """
+        Step a recorded fight to completion and extract its replay.
+        
+        Args:
+            fight_context: Context of the fight to run, already IN_PROGRESS
+        """
+        await self._run_fight_fast(fight_context)
+        
+        game_engine = fight_context.game_engine
+        if game_engine.replay_recorder:
+            # Save replay to file
+            replay_filepath = game_engine.replay_recorder.save_replay(game_engine.winner)
+            logger.info(f"Fight {fight_context.fight_id} replay saved to {replay_filepath}")
+
+            # Keep only a serialized handle in memory, plus a summary so listing
+            # and scoring replays never has to decode the frames
+            fight_context.replay_data = game_engine.replay_recorder.to_bytes()
+            fight_context.replay_summary = game_engine.replay_recorder.summary(fight_context.winner)
+
+            # Clear the recorder after extracting data
+            game_engine.replay_recorder = None
+    
     async def run_fight_batch(self, 
                             client_1_id: str, 
                             client_2_id: str,
@@ -263,56 +286,72 @@ class GameManager:
             "client_2_wins": 0,
             "recorded_fight_ids": [],
             "recorded_replays": [],
+            "recorded_replay_summaries": [],
             "start_time": datetime.now(),
             "end_time": None,
             "total_frames": 0
         }
+
+        # Per-fight outcomes, reduced once after the batch
+        winners = np.zeros(num_fights, dtype=np.int8)
+        frames = np.zeros(num_fights, dtype=np.int32)
+
+        # Which fights get recorded, decided once up front
+        record_mask = np.zeros(num_fights + 1, dtype=bool)
+        record_mask[record_interval::record_interval] = True
+        record_flags = record_mask.tolist()
+
+        # All replays recorded in this batch share one allocation that is released
+        # together, sized for the recorded fights and only touched once one records
+        replay_arena = ReplayArena.for_replays(int(record_mask.sum()), MAX_FRAMES)
         
         for fight_num in range(1, num_fights + 1):
             # Determine if this fight should be recorded
-            should_record = (fight_num % record_interval == 0)
+            should_record = record_flags[fight_num]
             
             fight_id = self.create_fight(client_1_id, client_2_id, player_1, player_2)
+            game_engine = self.active_fights[fight_id].game_engine
 
             # Debug: Check recording status
-            fight_context = self.active_fights[fight_id]
-            logger.debug(f"Fight {fight_num}: recording={fight_context.game_engine.is_recording}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Fight {fight_num}: recording={game_engine.is_recording}")
 
-            # Set recording flag
+            # Set recording flag (create_fight resets the engine with recording off)
             if should_record:
-                self.active_fights[fight_id].game_engine.set_recording(True)
+                game_engine.set_recording(True)
+                game_engine.set_replay_arena(replay_arena)
                 logger.info(f"Enabled recording for fight {fight_num}")
-            else:
-                self.active_fights[fight_id].game_engine.set_recording(False)
             
             # Run fight
             completed_context = await self.run_fight(fight_id)
+            completed_context.game_engine.set_replay_arena(None)
             
-            # Update batch statistics
-            batch_results["completed_fights"] += 1
-            batch_results["total_frames"] += completed_context.total_frames
-            
-            if completed_context.winner == 1:
-                batch_results["client_1_wins"] += 1
-            elif completed_context.winner == 2:
-                batch_results["client_2_wins"] += 1
+            # Record fight outcome
+            winners[fight_num - 1] = completed_context.winner
+            frames[fight_num - 1] = completed_context.total_frames
             
             # Store replay data for recorded fights
             if should_record:
                 logger.info(f"Fight {fight_num} should be recorded")
                 if completed_context.replay_data:
-                    logger.info(f"Fight {fight_num} has replay data with {len(completed_context.replay_data.get('frames', []))} frames")
+                    logger.info(f"Fight {fight_num} has replay data ({len(completed_context.replay_data)} bytes)")
                     batch_results["recorded_fight_ids"].append(fight_id)
                     batch_results["recorded_replays"].append(completed_context.replay_data)
+                    batch_results["recorded_replay_summaries"].append(completed_context.replay_summary)
                 else:
                     logger.warning(f"Fight {fight_num} was marked for recording but has no replay data")
-                    
-            # Reset player state for next fight
-            player_1.state.health = player_1.state.max_health
-            player_2.state.health = player_2.state.max_health
             
             # Yield control to allow other tasks to run
             await asyncio.sleep(0)
+
+        # Recorded replays hold their own frame copies, so the arena can be freed in one go
+        replay_arena = None
+
+        # Update batch statistics
+        batch_results["completed_fights"] = num_fights
+        batch_results["total_frames"] = int(frames.sum())
+        batch_results["client_1_wins"] = int((winners == 1).sum())
+        batch_results["client_2_wins"] = int((winners == 2).sum())
         
         batch_results["end_time"] = datetime.now()
         duration = (batch_results["end_time"] - batch_results["start_time"]).total_seconds()
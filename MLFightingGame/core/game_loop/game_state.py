@@ -1,8 +1,29 @@
-from typing import Dict, Any, Tuple, Optional
+from typing import Dict, Any, List, Tuple, Optional
 import numpy as np
 from ..data_classes import PlayerState
 from ..globals.constants import MAX_X_VELOCITY, MAX_Y_VELOCITY, MAX_FRAMES, ARENA_HEIGHT, ARENA_WIDTH
 from ..globals import State
+from ._state_kernels import build_state_vector, STATE_VECTOR_SIZE, JUMP_MASK, BLOCK_ACTIVE, ATTACK_ACTIVE
+
+# Hot per-player fields mirrored from PlayerState, one row per player (SoA layout)
+PLAYER_SOA_DTYPE = np.dtype([
+    ("x", "f8"),
+    ("y", "f8"),
+    ("health", "f8"),
+    ("velocity_x", "f8"),
+    ("velocity_y", "f8"),
+    ("is_jumping", "f8"),
+    ("is_blocking", "f8"),
+    ("is_attacking", "f8"),
+    ("attack_cooldown", "f8"),
+])
+_SOA_FIELDS = len(PLAYER_SOA_DTYPE.names)
+
+# At most two hits and two blocks can happen in a frame; leave headroom
+MAX_FRAME_EVENTS = 8
+
+# Raw fields, normalization factors and normalized fields for both players, then the distance
+_BLOCK_SIZE = 3 * 2 * _SOA_FIELDS + 2
 
 class GameState:
     """Represents the complete state of the game"""
@@ -17,81 +38,171 @@ class GameState:
         self.ground_level = 0  # Floor height
         
         # Players
-        self.players: Dict[int, PlayerState] = {
-            1: player1_state,
-            2: player2_state
-        }
+        # Indexed by player_id - 1
+        self.players: Tuple[Optional[PlayerState], Optional[PlayerState]] = (player1_state, player2_state)
         
         # Game state
         self.max_frames = MAX_FRAMES 
-        self.game_over = False
-        self.winner = None
         
-        # Combat events
-        self.hits_this_frame = []
-        self.blocks_this_frame = []
+        # Combat events as (attacker_id, defender_id), in fixed-capacity buffers
+        # that are reused every frame; only the first _n_hits/_n_blocks are live
+        self._hits = [None] * MAX_FRAME_EVENTS
+        self._n_hits = 0
+        self._blocks = [None] * MAX_FRAME_EVENTS
+        self._n_blocks = 0
+
+        # Reciprocals so normalization multiplies instead of divides
+        self._inv_arena_w = 1.0 / arena_width
+        self._inv_arena_h = 1.0 / arena_height
+        self._inv_max_vx = 1.0 / MAX_X_VELOCITY
+        self._inv_max_vy = 1.0 / MAX_Y_VELOCITY
+
+        # All per-frame numeric state lives in one contiguous block so clone() is a
+        # single copy; _bind_block exposes the views used by sync_players
+        self._bind_block(np.zeros(_BLOCK_SIZE, dtype=np.float64))
+        self._inv_norms[:] = 1.0
+        self._dx = 0.0
+        self._dy = 0.0
+
+        # Reused state vector buffers, one per player
+        self._sv_buf: Tuple[np.ndarray, np.ndarray] = (
+            np.empty(STATE_VECTOR_SIZE, dtype=np.float32),
+            np.empty(STATE_VECTOR_SIZE, dtype=np.float32)
+        )
+    
+    def _bind_block(self, block: np.ndarray) -> None:
+        """Point the SoA views at a block of _BLOCK_SIZE float64 values"""
+        self._block = block
+        size = 2 * _SOA_FIELDS
+        # Hot player fields, refreshed by sync_players, with a plain 2D float view
+        self._p_raw = block[:size].reshape(2, _SOA_FIELDS)
+        self._p = block[:size].view(PLAYER_SOA_DTYPE)
+        # Per-player normalization factors
+        self._inv_norms = block[size:2 * size].reshape(2, _SOA_FIELDS)
+        # Both players normalized in one pass; a state vector is two rows plus the distance
+        self._norm = block[2 * size:3 * size].reshape(2, _SOA_FIELDS)
+        self._dxy = block[3 * size:]
     
     def get_player(self, player_id: int) -> PlayerState:
         """Get player by ID"""
-        return self.players[player_id]
+        return self.players[player_id - 1]
 
     def set_player_state(self, player_id: int, player_state: PlayerState) -> None:
         """Set state for a specific player"""
-        self.players[player_id] = player_state
+        if player_id == 1:
+            self.players = (player_state, self.players[1])
+        else:
+            self.players = (self.players[0], player_state)
     
     def get_opponent(self, player_id: int) -> PlayerState:
         """Get opponent of given player"""
-        return self.players[2 if player_id == 1 else 1]
+        # player 1 -> index 1, player 2 -> index 0
+        return self.players[player_id & 1]
+    
+    @property
+    def hits_this_frame(self) -> List[Tuple[int, int]]:
+        """Hits landed this frame as (attacker_id, defender_id)"""
+        return self._hits[:self._n_hits]
+
+    @property
+    def blocks_this_frame(self) -> List[Tuple[int, int]]:
+        """Attacks blocked this frame as (attacker_id, blocker_id)"""
+        return self._blocks[:self._n_blocks]
+
+    def record_hit(self, attacker_id: int, defender_id: int) -> None:
+        """Record a hit landed this frame"""
+        self._hits[self._n_hits] = (attacker_id, defender_id)
+        self._n_hits += 1
+
+    def record_block(self, attacker_id: int, blocker_id: int) -> None:
+        """Record an attack blocked this frame"""
+        self._blocks[self._n_blocks] = (attacker_id, blocker_id)
+        self._n_blocks += 1
+
+    def clear_frame_events(self) -> None:
+        """Forget this frame's combat events without freeing the buffers"""
+        self._n_hits = 0
+        self._n_blocks = 0
     
     def get_distance_between_players(self) -> Tuple[float, float]:
-        """Get distance between players (x, y)"""
-        p1 = self.players[1]
-        p2 = self.players[2]
-        
-        return abs(p2.x - p1.x), abs(p2.y - p1.y)
+        """Get distance between players (x, y) as of the last sync_players() call"""
+        return self._dx, self._dy
+    
+    def sync_players(self) -> None:
+        """Mirror the hot fields of both PlayerStates into the SoA buffer"""
+        for row, player in enumerate(self.players):
+            state = player.current_state_value
+            self._p[row] = (
+                player.x,
+                player.y,
+                player.health,
+                player.velocity_x,
+                player.velocity_y,
+                (1 << state) & JUMP_MASK != 0,
+                state == BLOCK_ACTIVE,
+                state == ATTACK_ACTIVE,
+                player.attack_cooldown_remaining
+            )
+            self._inv_norms[row] = (
+                self._inv_arena_w,
+                self._inv_arena_h,
+                player.inv_max_health,
+                self._inv_max_vx,
+                self._inv_max_vy,
+                1.0,
+                1.0,
+                1.0,
+                player.inv_attack_cooldown
+            )
+
+        # Shared by both players' state vectors
+        p1, p2 = self.players
+        self._dx = abs(p2.x - p1.x)
+        self._dy = abs(p2.y - p1.y)
+
+        np.multiply(self._p_raw, self._inv_norms, out=self._norm)
+        self._dxy[0] = self._dx * self._inv_arena_w
+        self._dxy[1] = self._dy * self._inv_arena_h
+    
+    def snapshot(self) -> np.ndarray:
+        """
+        Get the structured per-player record taken by the last sync_players() call
+
+        Row 0 is player 1 and row 1 is player 2, with the fields of
+        PLAYER_SOA_DTYPE. The array is reused every frame, so treat it as
+        read-only and copy anything that must outlive the current frame.
+        """
+        return self._p
     
     def get_state_vector(self, player_id: int) -> np.ndarray:
         """
         Get normalized state vector for ML agent
         
         This includes all relevant game state information for decision making,
-        normalized to appropriate ranges.
+        normalized to appropriate ranges. Values are read from the snapshot taken
+        by the last sync_players() call. The returned array is a buffer owned by
+        this GameState and is overwritten on the next call for the same player,
+        so callers that keep it across frames must copy it.
         """
-        player = self.get_player(player_id)
-        opponent = self.get_opponent(player_id)
+        row = player_id - 1
+        opponent_row = 2 - player_id
 
-        player_is_jumping = player.current_state in [State.JUMP_ACTIVE, State.JUMP_RISING, State.JUMP_FALLING]
-        opponent_is_jumping = opponent.current_state in [State.JUMP_ACTIVE, State.JUMP_RISING, State.JUMP_FALLING]
-        
-        # Create feature vector
-        features = [
-            player.x / self.arena_width,                                            # player_x
-            player.y / self.arena_height,                                           # player_y
-            player.health / player.max_health,                                      # player_health
-            player.velocity_x / MAX_X_VELOCITY,                                     # player_velocity_x
-            player.velocity_y / MAX_Y_VELOCITY,                                     # player_velocity_y
-            float(player_is_jumping),                                               # player_is_jumping
-            float(player.current_state == State.BLOCK_ACTIVE),                      # player_is_blocking
-            float(player.current_state == State.ATTACK_ACTIVE),                     # player_is_attacking
-            player.attack_cooldown_remaining / player.attack_cooldown,              # player_attack_cooldown
-            
-            opponent.x / self.arena_width,                                          # opponent_x
-            opponent.y / self.arena_height,                                         # opponent_y
-            opponent.health / opponent.max_health,                                  # opponent_health
-            opponent.velocity_x / MAX_X_VELOCITY,                                   # opponent_velocity_x
-            opponent.velocity_y / MAX_Y_VELOCITY,                                   # opponent_velocity_y
-            float(opponent_is_jumping),                                             # opponent_is_jumping
-            float(opponent.current_state == State.BLOCK_ACTIVE),                    # opponent_is_blocking
-            float(opponent.current_state == State.ATTACK_ACTIVE),                   # opponent_is_attacking
-            opponent.attack_cooldown_remaining / opponent.attack_cooldown,          # opponent_attack_cooldown
-            
-            abs(opponent.x - player.x) / self.arena_width,                          # distance_x
-            abs(opponent.y - player.y) / self.arena_height                          # distance_y
-        ]
-        
-        return np.array(features, dtype=np.float32)
+        return build_state_vector(
+            self._sv_buf[row], self._norm[row], self._norm[opponent_row], self._dxy
+        )
     
     def clone(self) -> 'GameState':
-        """Create a deep copy of the game state"""
-        import copy
-        return copy.deepcopy(self)
\ No newline at end of file
+        """Create an independent copy of the game state"""
+        clone = GameState.__new__(GameState)
+        clone.__dict__.update(self.__dict__)
+        clone.players = tuple(
+            player.fast_clone() if player is not None else None for player in self.players
+        )
+        clone._hits = self._hits[:]
+        clone._blocks = self._blocks[:]
+        clone._bind_block(self._block.copy())
+        clone._sv_buf = (
+            np.empty(STATE_VECTOR_SIZE, dtype=np.float32),
+            np.empty(STATE_VECTOR_SIZE, dtype=np.float32)
+        )
+        return clone
@@ -1,7 +1,12 @@
 from enum import Enum
 
-class Action(Enum):
-    """Available actions for players"""
+class Action(int, Enum):
+    """
+    Available actions for players
+
+    Members are also ints, so the raw action indices produced by the agent can
+    be compared, hashed and used as table indices without wrapping them first.
+    """
     LEFT = 0
     RIGHT = 1
     JUMP = 2
@@ -1,3 +1,5 @@
+from pathlib import Path
+
 ARENA_WIDTH = 500
 ARENA_HEIGHT = 300
 GROUND_LEVEL = 0
@@ -10,4 +12,4 @@ MAX_Y_VELOCITY = 20
 
 STARTING_GOLD = 1000
 
-ITEM_DIRECTORY = "/Users/benrobson/Documents/Coding/Random Programs/MLFightingGame/MLFightingGame/core/shop/items"
\ No newline at end of file
+ITEM_DIRECTORY = str(Path(__file__).resolve().parent.parent / "shop" / "items")
\ No newline at end of file
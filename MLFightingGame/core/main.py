@@ -1,4 +1,7 @@
+import atexit
 import logging
+import logging.handlers
+import queue
 import time
 from pathlib import Path
 import sys
@@ -14,15 +17,20 @@ from .game_loop.game_manager import GameManager
 from .globals import Action, State
 
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('training_run.log')
-    ]
-)
+# Configure logging: callers only enqueue records, and a background listener
+# does the console and file writes so log I/O stays off the training loop
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handlers = [logging.StreamHandler(), logging.FileHandler('training_run.log')]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+_log_queue = queue.SimpleQueue()
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))  # full format applied by the listener
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
+_log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 
 logger = logging.getLogger("main")
 
@@ -86,9 +94,10 @@ class TrainingRunner:
             num_features=20
         )
         
-        logger.info(f"Created mock players: {self.game_manager.player1.player_id} vs {self.game_manager.player2.player_id}")
-        logger.info(f"Player 1: {self.game_manager.player1.fighter.name}")
-        logger.info(f"Player 2: {self.game_manager.player2.fighter.name}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Created mock players: {self.game_manager.player1.player_id} vs {self.game_manager.player2.player_id}")
+            logger.info(f"Player 1: {self.game_manager.player1.fighter.name}")
+            logger.info(f"Player 2: {self.game_manager.player2.fighter.name}")
     
     def run_training(self, num_fights: int = 50):
         """Run training fights between players"""
@@ -98,13 +107,13 @@ class TrainingRunner:
         self.game_manager._initialise_players()
         
         # Start time tracking
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         # Run fights
         self.game_manager._run_fights(num_fights)
         
         # Calculate training duration
-        duration = time.time() - start_time
+        duration = (time.perf_counter_ns() - start_time) / 1e9
         
         # Show results
         self._show_training_results(duration)
@@ -114,14 +123,17 @@ class TrainingRunner:
     
     def _show_training_results(self, duration: float):
         """Display training results"""
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        
         p1 = self.game_manager.player1
         p2 = self.game_manager.player2
         
         logger.info("=" * 50)
         logger.info(f"Training completed in {duration:.2f} seconds")
-        logger.info(f"Total fights: {p1.matches_played}")
-        logger.info(f"Player 1 ({p1.fighter.name}): {p1.wins} wins, {p1.losses} losses, {p1.wins/p1.matches_played:.1%} win rate")
-        logger.info(f"Player 2 ({p2.fighter.name}): {p2.wins} wins, {p2.losses} losses, {p2.wins/p2.matches_played:.1%} win rate")
+        logger.info(f"Total fights: {p1.total_fights}")
+        logger.info(f"Player 1 ({p1.fighter.name}): {p1.wins} wins, {p1.losses} losses, {p1.wins/max(1, p1.total_fights):.1%} win rate")
+        logger.info(f"Player 2 ({p2.fighter.name}): {p2.wins} wins, {p2.losses} losses, {p2.wins/max(1, p2.total_fights):.1%} win rate")
         logger.info(f"Player 1 final epsilon: {p1.learning_parameters.epsilon:.4f}")
         logger.info(f"Player 2 final epsilon: {p2.learning_parameters.epsilon:.4f}")
         logger.info(f"Player 1 total reward: {p1.total_reward:.2f}")
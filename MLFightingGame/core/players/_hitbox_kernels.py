@@ -0,0 +1,45 @@
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional, fall back to plain Python
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Boxes are (x1, y1, x2, y2) written into caller-owned float64 buffers so the
+# per-frame collision queries allocate nothing. float64 keeps overlap results
+# identical to the tuple-based version
+
+@njit("f8[::1](f8[::1], f8, f8, f8, f8)", cache=True, fastmath=True)
+def compute_hitbox(out, x, y, width, height):
+    """Write the body hitbox centred on (x, y) into out"""
+    half_w = width / 2
+    half_h = height / 2
+    out[0] = x - half_w
+    out[1] = y - half_h
+    out[2] = x + half_w
+    out[3] = y + half_h
+    return out
+
+
+@njit("f8[::1](f8[::1], f8, f8, f8, b1, f8, f8)", cache=True, fastmath=True)
+def compute_attack_hitbox(out, x, y, width, facing_right, x_range, y_range):
+    """Write the attack hitbox extending x_range from the fighter's front edge into out"""
+    direction = 1.0 if facing_right else -1.0
+    start_x = x + width / 2 * direction
+    end_x = start_x + x_range * direction
+    out[0] = min(start_x, end_x)
+    out[1] = y - y_range / 2
+    out[2] = max(start_x, end_x)
+    out[3] = y + y_range / 2
+    return out
+
+
+@njit("b1(f8[::1], f8[::1])", cache=True, fastmath=True)
+def boxes_overlap(box1, box2):
+    """Check if two (x1, y1, x2, y2) boxes overlap, edges touching counts"""
+    return not (box1[2] < box2[0] or box2[2] < box1[0] or box1[3] < box2[1] or box2[3] < box1[1])
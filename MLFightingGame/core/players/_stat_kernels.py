@@ -0,0 +1,27 @@
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional, fall back to plain Python
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# No explicit signature: the cached item modifier vectors are read-only arrays,
+# which numba types separately from writable ones. Compiled specializations
+# are still cached on disk, and tools/warmup_numba.py populates that cache
+
+@njit(cache=True)
+def combine_stats(out, base, weapon_mul, weapon_add, armour_mul, armour_add):
+    """
+    Write base * (weapon_mul * armour_mul) + (weapon_add + armour_add) into out
+
+    Evaluated in the same order as the NumPy expression it replaces, so the
+    results are bit-identical.
+    """
+    for i in range(base.shape[0]):
+        out[i] = base[i] * (weapon_mul[i] * armour_mul[i]) + (weapon_add[i] + armour_add[i])
+    return out
@@ -1,5 +1,6 @@
 import json
 import logging
+import os
 from pathlib import Path
 from typing import Dict, Optional
 from ..data_classes import Fighter, FighterFrameData, ActionFrameData
@@ -7,17 +8,56 @@ from ..globals import Action
 
 logger = logging.getLogger(__name__)
 
+# Environment variable that overrides the bundled fighters.json
+CONFIG_PATH_ENV = "MLFIGHTER_FIGHTERS_CONFIG"
+
+# Frame data used for any action a fighter's config leaves out
+_DEFAULTS: Dict[Action, ActionFrameData] = {
+    Action.LEFT: ActionFrameData(action=Action.LEFT, startup_frames=0, active_frames=1, recovery_frames=0),
+    Action.RIGHT: ActionFrameData(action=Action.RIGHT, startup_frames=0, active_frames=1, recovery_frames=0),
+    Action.JUMP: ActionFrameData(action=Action.JUMP, startup_frames=2, active_frames=15, recovery_frames=3),
+    Action.BLOCK: ActionFrameData(action=Action.BLOCK, startup_frames=2, active_frames=10, recovery_frames=3),
+    Action.ATTACK: ActionFrameData(action=Action.ATTACK, startup_frames=3, active_frames=2, recovery_frames=7),
+    Action.IDLE: ActionFrameData(action=Action.IDLE, startup_frames=0, active_frames=1, recovery_frames=0),
+}
+
 class FighterLoader:
     """Loads fighter data from JSON configuration"""
     
     _fighters_cache: Dict[str, Fighter] = {}
     _config_path: Path = None
+    _raw_data: Optional[Dict] = None
     
     @classmethod
     def set_config_path(cls, path: Path):
         """Set the path to the fighters configuration file"""
+        path = Path(path)
+        if path == cls._config_path:
+            return  # Keep the caches for an unchanged config
+        
         cls._config_path = path
         cls._fighters_cache.clear()
+        cls._raw_data = None
+    
+    @classmethod
+    def _load_raw(cls) -> Dict:
+        """Parse the fighters config once and serve every later lookup from memory"""
+        if cls._raw_data is not None:
+            return cls._raw_data
+        
+        if cls._config_path is None:
+            # Resolved once, on first use, rather than whenever a Player is built
+            env_path = os.environ.get(CONFIG_PATH_ENV)
+            cls._config_path = Path(env_path) if env_path else Path(__file__).parent / "fighters.json"
+        
+        try:
+            with open(cls._config_path, 'r') as f:
+                cls._raw_data = json.load(f)
+        except FileNotFoundError:
+            logger.error(f"Fighters config file not found at {cls._config_path}")
+            raise
+        
+        return cls._raw_data
     
     @classmethod
     def load_fighter(cls, fighter_type: str) -> Fighter:
@@ -38,17 +78,7 @@ class FighterLoader:
         if fighter_type in cls._fighters_cache:
             return cls._fighters_cache[fighter_type]
         
-        # Load from file
-        if cls._config_path is None:
-            # Default path - adjust based on your project structure
-            cls._config_path = Path(__file__).parent.parent / "players" / "fighters.json"
-        
-        try:
-            with open(cls._config_path, 'r') as f:
-                data = json.load(f)
-        except FileNotFoundError:
-            logger.error(f"Fighters config file not found at {cls._config_path}")
-            raise
+        data = cls._load_raw()
         
         if fighter_type not in data['fighters']:
             available = list(data['fighters'].keys())
@@ -94,7 +124,8 @@ class FighterLoader:
     @classmethod
     def _build_frame_data(cls, frame_config: Dict) -> FighterFrameData:
         """Build FighterFrameData from JSON configuration"""
-        actions = {}
+        # Start from the defaults so every action has frame data
+        actions = dict(_DEFAULTS)
         
         for action_name, frames in frame_config.items():
             try:
@@ -109,27 +140,12 @@ class FighterLoader:
                 logger.warning(f"Unknown action '{action_name}' in frame data")
                 continue
         
-        # Ensure all actions have frame data
-        for action in Action:
-            if action not in actions:
-                # Use default frame data for missing actions
-                actions[action] = cls._get_default_action_data(action)
-        
         return FighterFrameData(actions=actions)
     
     @classmethod
     def _get_default_action_data(cls, action: Action) -> ActionFrameData:
         """Get default frame data for an action"""
-        if action == Action.ATTACK:
-            return ActionFrameData(action=action, startup_frames=3, active_frames=2, recovery_frames=7)
-        elif action == Action.JUMP:
-            return ActionFrameData(action=action, startup_frames=2, active_frames=15, recovery_frames=3)
-        elif action == Action.BLOCK:
-            return ActionFrameData(action=action, startup_frames=2, active_frames=10, recovery_frames=3)
-        elif action in [Action.LEFT, Action.RIGHT]:
-            return ActionFrameData(action=action, startup_frames=0, active_frames=1, recovery_frames=0)
-        else:  # IDLE
-            return ActionFrameData(action=action, startup_frames=0, active_frames=1, recovery_frames=0)
+        return _DEFAULTS[action]
     
     @classmethod
     def get_available_fighters(cls) -> Dict[str, str]:
@@ -139,11 +155,7 @@ class FighterLoader:
         Returns:
             Dict mapping fighter type to description
         """
-        if cls._config_path is None:
-            cls._config_path = Path(__file__).parent.parent / "players" / "fighters.json"
-        
-        with open(cls._config_path, 'r') as f:
-            data = json.load(f)
+        data = cls._load_raw()
         
         return {
             fighter_type: fighter_data['description']
@@ -1,12 +1,17 @@
+import logging
 import torch
 import torch.nn as nn
 import torch.optim as optim
 import torch.nn.functional as F
-from collections import deque
 import random
+from pathlib import Path
 from typing import List, Optional, Tuple
 import numpy as np
 
+from ..data_classes import LearningParameters
+
+logger = logging.getLogger(__name__)
+
 
 class DQNetwork(nn.Module):
     """Fixed architecture DQN"""
@@ -28,16 +33,46 @@ class DQNetwork(nn.Module):
             nn.Linear(64, output_size)
         )
     
-    def forward(self, x, feature_mask=None):
-        """Forward pass with optional feature masking"""
+    def forward(self, x, feature_mask=None, dropout_rows=None):
+        """
+        Forward pass with optional feature masking
+        
+        If dropout_rows is given, dropout only applies to the first
+        dropout_rows rows and the rest of the batch passes through as in
+        eval mode.
+        """
         if feature_mask is not None:
             x = x * feature_mask
-        return self.network(x)
+        if dropout_rows is None or not self.training:
+            return self.network(x)
+        
+        for layer in self.network:
+            if isinstance(layer, nn.Dropout):
+                x = torch.cat([layer(x[:dropout_rows]), x[dropout_rows:]], dim=0)
+            else:
+                x = layer(x)
+        return x
 
 
 class MLAgent:
     """Base DQN Agent focused on core functionality"""
     
+    # Replay memory fields in (s, a, r, s', done) order
+    _MEMORY_FIELDS = ('states', 'actions', 'rewards', 'next_states', 'dones')
+    
+    # Fixed attribute layout, no per-instance __dict__ (subclasses add their own)
+    __slots__ = (
+        'num_features', 'num_actions', 'learning_parameters', 'learning_rate', 'device', '_rng',
+        'gamma', 'memory_size', 'batch_size', 'update_frequency', 'target_update_frequency',
+        'grad_accumulation_steps', '_target_dtype',
+        'q_network', 'target_network', '_q_infer', '_q_infer_ready', 'optimizer', '_target_stream',
+        '_states', '_actions', '_rewards', '_next_states', '_dones', '_write_idx', '_size',
+        '_pinned_batch', '_batch_copied',
+        'steps', 'episodes',
+        'feature_mask', '_cpu_feature_mask', '_input_mask', '_action_mask_cache',
+        '__weakref__',
+    )
+    
     def __init__(self, 
                  num_features: int,
                  num_actions: int,
@@ -46,36 +81,97 @@ class MLAgent:
                  epsilon_min: float = 0.01,
                  learning_rate: float = 0.001,
                  initial_feature_mask: Optional[np.ndarray] = None,
-                 device: str = None
+                 learning_parameters: Optional[LearningParameters] = None,
+                 device: str = None,
+                 seed: Optional[int] = None,
+                 batch_size: Optional[int] = None,
+                 update_frequency: Optional[int] = None,
+                 grad_accumulation_steps: int = 1
                  ):
         
         # Core parameters
         self.num_features = num_features
         self.num_actions = num_actions
-        self.epsilon = epsilon
-        self.epsilon_decay = epsilon_decay
-        self.epsilon_min = epsilon_min
+        # The exploration schedule is read through learning_parameters, which an
+        # owner (Player) may share so its epsilon changes need no mirroring here
+        if learning_parameters is None:
+            learning_parameters = LearningParameters(
+                epsilon=epsilon,
+                epsilon_decay=epsilon_decay,
+                epsilon_min=epsilon_min,
+                learning_rate=learning_rate
+            )
+        self.learning_parameters = learning_parameters
         self.learning_rate = learning_rate
         self.device = device or ('cuda' if torch.cuda.is_available() else 'cpu')
         
+        # Vectorized random draws (batched exploration, replay sampling)
+        self._rng = np.random.Generator(np.random.SFC64(seed))
+        
         # Fixed training parameters
         self.gamma = 0.99
         self.memory_size = 10000
-        self.batch_size = 32
-        self.update_frequency = 4
         self.target_update_frequency = 100
         
+        # Minibatch sizing: batch-32 GEMMs leave a GPU mostly idle, so CUDA defaults
+        # to larger batches trained twice as often. Each optimizer step averages
+        # gradients over grad_accumulation_steps sampled batches
+        on_cuda = torch.device(self.device).type == 'cuda'
+        self.batch_size = batch_size or (256 if on_cuda else 32)
+        self.update_frequency = update_frequency or (2 if on_cuda else 4)
+        self.grad_accumulation_steps = max(1, grad_accumulation_steps)
+        
         # Neural networks
         self.q_network = DQNetwork(num_features, num_actions).to(self.device)
         self.target_network = DQNetwork(num_features, num_actions).to(self.device)
         self.target_network.load_state_dict(self.q_network.state_dict())
         self.target_network.eval()
         
+        # The target network is inference-only, so on GPUs with bf16 support it is
+        # held in bf16. load_state_dict casts the fp32 online weights on each sync
+        self._target_dtype = torch.float32
+        if torch.device(self.device).type == 'cuda' and torch.cuda.is_bf16_supported():
+            self._target_dtype = torch.bfloat16
+            self.target_network.to(self._target_dtype)
+        
+        # Single-state inference (get_action / get_q_values) is dominated by
+        # dispatch overhead, so on CUDA it goes through a compiled, graph-captured
+        # copy of the online network. Training keeps using the eager module
+        self._q_infer = self.q_network
+        if torch.device(self.device).type == 'cuda' and hasattr(torch, 'compile'):
+            self._q_infer = torch.compile(self.q_network, mode='reduce-overhead', dynamic=False)
+        # Compilation happens lazily on the first compiled call, checked once in _infer
+        self._q_infer_ready = self._q_infer is self.q_network
+        
         # Optimizer
         self.optimizer = optim.Adam(self.q_network.parameters(), lr=learning_rate)
         
-        # Experience replay
-        self.memory = deque(maxlen=self.memory_size)
+        # Experience replay: a ring buffer with one contiguous array per field
+        self._states = np.empty((self.memory_size, num_features), dtype=np.float32)
+        self._next_states = np.empty((self.memory_size, num_features), dtype=np.float32)
+        self._actions = np.empty(self.memory_size, dtype=np.int64)
+        self._rewards = np.empty(self.memory_size, dtype=np.float32)
+        self._dones = np.empty(self.memory_size, dtype=np.float32)
+        self._write_idx = 0
+        self._size = 0
+        
+        # Pinned staging tensors so sampled batches reach the GPU asynchronously
+        self._pinned_batch = None
+        self._batch_copied = None
+        if torch.device(self.device).type == 'cuda':
+            self._pinned_batch = (
+                torch.empty((self.batch_size, num_features), dtype=torch.float32, pin_memory=True),
+                torch.empty(self.batch_size, dtype=torch.int64, pin_memory=True),
+                torch.empty(self.batch_size, dtype=torch.float32, pin_memory=True),
+                torch.empty((self.batch_size, num_features), dtype=torch.float32, pin_memory=True),
+                torch.empty(self.batch_size, dtype=torch.float32, pin_memory=True),
+            )
+            self._batch_copied = torch.cuda.Event()
+        
+        # Side stream for the target forward, which only depends on next_states
+        self._target_stream = None
+        if torch.device(self.device).type == 'cuda':
+            self._target_stream = torch.cuda.Stream()
         
         # Training state
         self.steps = 0
@@ -83,12 +179,40 @@ class MLAgent:
         
         # Feature mask (default: all features active)
         # Feature mask (default: all features active if not provided)
+        self.feature_mask = torch.ones(num_features, device=self.device)
         if initial_feature_mask is not None:
-            self.feature_mask = torch.FloatTensor(initial_feature_mask).to(self.device)
+            self._set_feature_mask(initial_feature_mask)
         else:
-            self.feature_mask = torch.ones(num_features).to(self.device)
+            self._set_feature_mask(np.ones(num_features, dtype=np.float32))
+        
+        # Valid-action masks on self.device, keyed by tuple(available_actions)
+        self._action_mask_cache = {}
 
     
+    @property
+    def epsilon(self) -> float:
+        return self.learning_parameters.epsilon
+    
+    @epsilon.setter
+    def epsilon(self, value: float):
+        self.learning_parameters.epsilon = value
+    
+    @property
+    def epsilon_decay(self) -> float:
+        return self.learning_parameters.epsilon_decay
+    
+    @epsilon_decay.setter
+    def epsilon_decay(self, value: float):
+        self.learning_parameters.epsilon_decay = value
+    
+    @property
+    def epsilon_min(self) -> float:
+        return self.learning_parameters.epsilon_min
+    
+    @epsilon_min.setter
+    def epsilon_min(self, value: float):
+        self.learning_parameters.epsilon_min = value
+    
     def get_action(self, 
                    state: np.ndarray, 
                    available_actions: Optional[List[int]] = None,
@@ -117,15 +241,81 @@ class MLAgent:
         # Get Q-values
         with torch.no_grad():
             state_tensor = torch.FloatTensor(state).unsqueeze(0).to(self.device)
-            q_values = self.q_network(state_tensor, self.feature_mask).squeeze(0)
+            q_values = self._infer(state_tensor).squeeze(0)
             
             # Mask invalid actions
-            masked_q = q_values.clone()
-            for i in range(self.num_actions):
-                if i not in available_actions:
-                    masked_q[i] = float('-inf')
-            
-            return masked_q.argmax().item()
+            mask = self._get_action_mask(available_actions)
+            # Out of place: the compiled module's output is a reused CUDA graph buffer
+            return q_values.masked_fill(~mask, float('-inf')).argmax().item()
+    
+    def _infer(self, state_tensor: torch.Tensor) -> torch.Tensor:
+        """Online-network forward for single-state inference"""
+        if self._q_infer_ready:
+            return self._q_infer(state_tensor, self._input_mask)
+        
+        # First compiled call: compilation needs a working toolchain, so fall
+        # back to eager for good if the backend fails to build the graph
+        try:
+            q_values = self._q_infer(state_tensor, self._input_mask)
+        except torch._dynamo.exc.BackendCompilerFailed as e:
+            logger.warning(f"Compiled Q-network unavailable, using eager mode: {e}")
+            self._q_infer = self.q_network
+            q_values = self.q_network(state_tensor, self._input_mask)
+        self._q_infer_ready = True
+        return q_values
+    
+    def _get_action_mask(self, available_actions: List[int]) -> torch.Tensor:
+        """Bool tensor marking available_actions, built once per distinct action set"""
+        key = tuple(available_actions)
+        mask = self._action_mask_cache.get(key)
+        if mask is None:
+            mask = torch.zeros(self.num_actions, dtype=torch.bool)
+            mask[list(key)] = True
+            mask = mask.to(self.device)
+            self._action_mask_cache[key] = mask
+        return mask
+    
+    def get_actions_batch(self,
+                          states: np.ndarray,
+                          action_masks: Optional[np.ndarray] = None,
+                          epsilon: Optional[float] = None) -> np.ndarray:
+        """
+        Select actions for many states with one forward pass
+        
+        Used when several fights step in lockstep against the same agent, so
+        the network sees one (B, num_features) batch per frame instead of B
+        single-row calls.
+        
+        Args:
+            states: State vectors, shape (B, num_features)
+            action_masks: Boolean mask of valid actions, shape (B, num_actions)
+                          (if None, all actions valid)
+            epsilon: Override epsilon for this batch (if None, use self.epsilon)
+        
+        Returns:
+            Selected action indices, shape (B,)
+        """
+        eps = epsilon if epsilon is not None else self.epsilon
+        batch_size = states.shape[0]
+        
+        # Greedy actions for the whole batch
+        with torch.no_grad():
+            state_tensor = torch.from_numpy(np.ascontiguousarray(states, dtype=np.float32)).to(self.device)
+            q_values = self.q_network(state_tensor, self._input_mask)
+            if action_masks is not None:
+                mask_tensor = torch.from_numpy(np.asarray(action_masks, dtype=bool)).to(self.device)
+                q_values = q_values.masked_fill(~mask_tensor, float('-inf'))
+            greedy = q_values.argmax(dim=1).cpu().numpy()
+        
+        # Epsilon-greedy: replace exploring rows with a random valid action
+        explore = self._rng.random(batch_size) < eps
+        if not explore.any():
+            return greedy
+        if action_masks is None:
+            random_actions = self._rng.integers(0, self.num_actions, batch_size)
+        else:
+            random_actions = np.argmax(self._rng.random((batch_size, self.num_actions)) * action_masks, axis=1)
+        return np.where(explore, random_actions, greedy)
     
     def update(self, 
                state: np.ndarray, 
@@ -142,9 +332,12 @@ class MLAgent:
             reward: Reward received (already shaped by child class)
             next_state: Next state
             done: Whether episode ended
+        
+        Both state arrays are copied into replay memory, so reused buffers such as
+        those from GameState.get_state_vector can be passed directly.
         """
         # Store experience
-        self.memory.append((state, action, reward, next_state, done))
+        self._remember(state, action, reward, next_state, done)
         
         # Update step counter
         self.steps += 1
@@ -152,48 +345,197 @@ class MLAgent:
         # Update epsilon on episode end
         if done:
             self.episodes += 1
-            self.epsilon = max(self.epsilon_min, self.epsilon * self.epsilon_decay)
+            params = self.learning_parameters
+            eps = params.epsilon * params.epsilon_decay
+            params.epsilon = eps if eps > params.epsilon_min else params.epsilon_min
         
         # Train if enough samples
-        if len(self.memory) >= self.batch_size and self.steps % self.update_frequency == 0:
+        if self._size >= self.batch_size and self.steps % self.update_frequency == 0:
             self._train_step()
         
         # Update target network
         if self.steps % self.target_update_frequency == 0:
             self.target_network.load_state_dict(self.q_network.state_dict())
     
+    def update_batch(self,
+                     states: np.ndarray,
+                     actions: np.ndarray,
+                     rewards: np.ndarray,
+                     next_states: np.ndarray,
+                     dones: np.ndarray):
+        """
+        Update the agent with a block of experience generated elsewhere
+        
+        Intended for a learner draining transitions produced by actor
+        processes that run fights against a frozen copy of the policy (see
+        policy_state_dict). The whole block is written to replay memory with
+        one vectorized copy before any training, so this is not the same as
+        calling update once per transition:
+        
+        - epsilon is decayed once per done flag in the block, all up front
+        - training is gated on the replay size after the whole block is
+          written; one train step then runs per update_frequency boundary the
+          step counter crossed, back to back, each able to sample any row of
+          the block
+        - the target network is synced at most once, if a
+          target_update_frequency boundary was crossed
+        - subclass update overrides (e.g. Player.update) are not called, so
+          rewards must already be shaped
+        
+        Args:
+            states: State vectors, shape (N, num_features)
+            actions: Actions taken, shape (N,)
+            rewards: Rewards received, shape (N,)
+            next_states: Next state vectors, shape (N, num_features)
+            dones: Episode end flags, shape (N,)
+        """
+        count = len(actions)
+        if count == 0:
+            return
+        self._remember_batch(states, actions, rewards, next_states, dones)
+        
+        start = self.steps
+        self.steps += count
+        
+        # Epsilon decays once per finished episode
+        finished = int(np.count_nonzero(dones))
+        if finished:
+            self.episodes += finished
+            params = self.learning_parameters
+            eps = params.epsilon * params.epsilon_decay ** finished
+            params.epsilon = eps if eps > params.epsilon_min else params.epsilon_min
+        
+        # One train step per update_frequency boundary crossed
+        if self._size >= self.batch_size:
+            for _ in range(self.steps // self.update_frequency - start // self.update_frequency):
+                self._train_step()
+        
+        if self.steps // self.target_update_frequency != start // self.target_update_frequency:
+            self.target_network.load_state_dict(self.q_network.state_dict())
+    
+    def policy_state_dict(self) -> dict:
+        """CPU copy of the online network's weights for actor processes"""
+        return {k: v.detach().to('cpu', copy=True) for k, v in self.q_network.state_dict().items()}
+    
+    def load_policy_state_dict(self, state_dict: dict):
+        """Refresh the online network from a learner's policy_state_dict"""
+        self.q_network.load_state_dict(state_dict)
+    
+    def _remember(self, state, action: int, reward: float, next_state, done: bool):
+        """Write one transition into the replay ring buffer"""
+        i = self._write_idx
+        self._states[i] = state
+        self._actions[i] = action
+        self._rewards[i] = reward
+        self._next_states[i] = next_state
+        self._dones[i] = done
+        
+        self._write_idx = (i + 1) % self.memory_size
+        if self._size < self.memory_size:
+            self._size += 1
+    
+    def _remember_batch(self, states, actions, rewards, next_states, dones):
+        """Write N transitions into the replay ring buffer, wrapping as needed"""
+        count = len(actions)
+        if count > self.memory_size:
+            # Only the newest memory_size transitions would survive anyway
+            keep = slice(count - self.memory_size, count)
+            states, actions, rewards = states[keep], actions[keep], rewards[keep]
+            next_states, dones = next_states[keep], dones[keep]
+            count = self.memory_size
+        
+        idx = (self._write_idx + np.arange(count)) % self.memory_size
+        self._states[idx] = states
+        self._actions[idx] = actions
+        self._rewards[idx] = rewards
+        self._next_states[idx] = next_states
+        self._dones[idx] = dones
+        
+        self._write_idx = (self._write_idx + count) % self.memory_size
+        self._size = min(self.memory_size, self._size + count)
+    
+    def _recent(self, field: np.ndarray, count: int) -> np.ndarray:
+        """
+        The most recent count rows of a replay field, oldest first
+        
+        A view into the ring buffer unless the range wraps around its end,
+        in which case the two pieces are joined.
+        """
+        count = min(count, self._size)
+        start = self._write_idx - count
+        if start >= 0:
+            return field[start:self._write_idx]
+        return np.concatenate((field[start:], field[:self._write_idx]))
+    
+    def _sample_batch(self, idx: np.ndarray) -> Tuple[torch.Tensor, ...]:
+        """Gather sampled transitions into device tensors"""
+        fields = (self._states, self._actions, self._rewards, self._next_states, self._dones)
+        if self._pinned_batch is None:
+            # Fancy indexing gathers each field into one contiguous slab
+            return tuple(torch.from_numpy(field[idx]).to(self.device) for field in fields)
+        
+        # The previous batch's copies must finish before the staging tensors are reused
+        self._batch_copied.synchronize()
+        batch = []
+        for staging, field in zip(self._pinned_batch, fields):
+            # Gather straight into the pinned staging memory, no intermediate slab
+            np.take(field, idx, axis=0, out=staging.numpy())
+            batch.append(staging.to(self.device, non_blocking=True))
+        self._batch_copied.record()
+        return tuple(batch)
+    
     def _train_step(self):
         """Perform one training step"""
+        self.optimizer.zero_grad()
+        for _ in range(self.grad_accumulation_steps):
+            loss = self._batch_loss()
+            (loss / self.grad_accumulation_steps).backward()
+        
+        torch.nn.utils.clip_grad_norm_(self.q_network.parameters(), 1.0)
+        self.optimizer.step()
+    
+    def _batch_loss(self) -> torch.Tensor:
+        """Double DQN loss on one freshly sampled minibatch"""
         # Sample batch
-        batch = random.sample(self.memory, self.batch_size)
+        idx = self._rng.integers(0, self._size, self.batch_size)
         
         # Prepare tensors
-        states = torch.FloatTensor([e[0] for e in batch]).to(self.device)
-        actions = torch.LongTensor([e[1] for e in batch]).to(self.device)
-        rewards = torch.FloatTensor([e[2] for e in batch]).to(self.device)
-        next_states = torch.FloatTensor([e[3] for e in batch]).to(self.device)
-        dones = torch.FloatTensor([e[4] for e in batch]).to(self.device)
+        states, actions, rewards, next_states, dones = self._sample_batch(idx)
         
         # Apply feature masks
-        states = states * self.feature_mask
-        next_states = next_states * self.feature_mask
+        if self._input_mask is not None:
+            states = states * self._input_mask
+            next_states = next_states * self._input_mask
         
-        # Current Q values
-        current_q_values = self.q_network(states).gather(1, actions.unsqueeze(1))
+        # Start the target forward first; on CUDA it runs on a side stream and
+        # overlaps the online forward below
+        with torch.no_grad():
+            target_input = next_states.to(self._target_dtype)
+            if self._target_stream is None:
+                target_q_all = self.target_network(target_input)
+            else:
+                self._target_stream.wait_stream(torch.cuda.current_stream())
+                with torch.cuda.stream(self._target_stream):
+                    target_q_all = self.target_network(target_input)
+                target_input.record_stream(self._target_stream)
+                target_q_all.record_stream(torch.cuda.current_stream())
+        
+        # One online forward over [states; next_states] serves both the
+        # current Q values and the Double DQN action selection. Dropout is
+        # kept off the next_states half so it does not perturb the bootstrap
+        batch_size = states.shape[0]
+        q_all = self.q_network(torch.cat([states, next_states], dim=0), dropout_rows=batch_size)
+        current_q_values = q_all[:batch_size].gather(1, actions.unsqueeze(1))
         
         # Next Q values (Double DQN)
         with torch.no_grad():
-            next_actions = self.q_network(next_states).argmax(dim=1, keepdim=True)
-            next_q_values = self.target_network(next_states).gather(1, next_actions).squeeze(1)
+            next_actions = q_all[batch_size:].argmax(dim=1, keepdim=True)
+            if self._target_stream is not None:
+                torch.cuda.current_stream().wait_stream(self._target_stream)
+            next_q_values = target_q_all.gather(1, next_actions).squeeze(1).float()
             targets = rewards + (1 - dones) * self.gamma * next_q_values
         
-        # Loss and optimization
-        loss = F.mse_loss(current_q_values.squeeze(), targets)
-        
-        self.optimizer.zero_grad()
-        loss.backward()
-        torch.nn.utils.clip_grad_norm_(self.q_network.parameters(), 1.0)
-        self.optimizer.step()
+        return F.mse_loss(current_q_values.squeeze(), targets)
     
     def update_parameters(self,
                          epsilon: Optional[float] = None,
@@ -221,23 +563,47 @@ class MLAgent:
                 param_group['lr'] = learning_rate
         
         if feature_mask is not None:
-            self.feature_mask = torch.FloatTensor(feature_mask).to(self.device)
+            self._set_feature_mask(feature_mask)
+    
+    def _set_feature_mask(self, feature_mask: np.ndarray):
+        """
+        Install a feature mask
+        
+        _cpu_feature_mask is the canonical copy; feature_mask is a device tensor
+        allocated once and refreshed in place. _input_mask is what forward passes
+        multiply by, and is None while every feature is active so the default
+        all-ones mask costs nothing. Masks change as features are unlocked, so
+        they are not folded into weights.
+        """
+        self._cpu_feature_mask = np.array(feature_mask, dtype=np.float32)
+        self.feature_mask.copy_(torch.from_numpy(self._cpu_feature_mask))
+        self._input_mask = self.feature_mask if (self._cpu_feature_mask == 0).any() else None
     
     def save_weights(self, filepath: str):
-        """Save network weights and training state"""
+        """
+        Save network weights and training state
+        
+        The newest 1000 experiences go to a sidecar .npz next to filepath, one
+        array per replay field, rather than being pickled into the checkpoint.
+        """
         torch.save({
             'q_network_state': self.q_network.state_dict(),
-            'target_network_state': self.target_network.state_dict(),
+            'target_network_state': {k: v.float() for k, v in self.target_network.state_dict().items()},
             'optimizer_state': self.optimizer.state_dict(),
             'steps': self.steps,
             'episodes': self.episodes,
             'epsilon': self.epsilon,
-            'memory': list(self.memory)[-1000:]  # Save last 1000 experiences
+            'memory_count': min(1000, self._size)
         }, filepath)
+        
+        arrays = (self._states, self._actions, self._rewards, self._next_states, self._dones)
+        np.savez(self._memory_path(filepath), **{name: self._recent(array, 1000) for name, array in zip(self._MEMORY_FIELDS, arrays)})
     
     def load_weights(self, filepath: str):
         """Load network weights while keeping current parameters"""
-        checkpoint = torch.load(filepath, map_location=self.device)
+        # mmap: tensors are paged in from the checkpoint file as load_state_dict
+        # copies them, instead of the whole archive being read into memory first
+        checkpoint = torch.load(filepath, map_location=self.device, mmap=True)
         
         self.q_network.load_state_dict(checkpoint['q_network_state'])
         self.target_network.load_state_dict(checkpoint['target_network_state'])
@@ -248,13 +614,24 @@ class MLAgent:
         self.episodes = checkpoint.get('episodes', 0)
         
         # Optionally restore memory
-        if 'memory' in checkpoint:
-            for exp in checkpoint['memory']:
-                self.memory.append(tuple(exp))
+        memory_path = self._memory_path(filepath)
+        if memory_path.exists():
+            with np.load(memory_path) as memory:
+                columns = [memory[name] for name in self._MEMORY_FIELDS]
+            if len(columns[1]):
+                self._remember_batch(*columns)
+        elif checkpoint.get('memory'):
+            # Older checkpoints pickle a list of (s, a, r, s', done) tuples
+            self._remember_batch(*[np.asarray(column) for column in zip(*checkpoint['memory'])])
+    
+    @staticmethod
+    def _memory_path(filepath: str) -> Path:
+        """Sidecar file holding the replay memory saved with a checkpoint"""
+        return Path(filepath).with_suffix('.npz')
     
     def get_q_values(self, state: np.ndarray) -> np.ndarray:
         """Get Q-values for a state (useful for debugging)"""
         with torch.no_grad():
             state_tensor = torch.FloatTensor(state).unsqueeze(0).to(self.device)
-            q_values = self.q_network(state_tensor, self.feature_mask)
+            q_values = self._infer(state_tensor)
             return q_values.cpu().numpy().squeeze()
\ No newline at end of file
@@ -1,22 +1,190 @@
-from typing import List, Dict, Set, Optional, Tuple
+from typing import Callable, ClassVar, List, Dict, Set, Optional, Tuple
 from dataclasses import dataclass, field
+from functools import lru_cache
 import json
 import logging
+import os
 from pathlib import Path
 import numpy as np
 
-from ..data_classes import Fighter, Weapon, Armour, LearningParameters, PlayerInventory
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:  # orjson is optional, fall back to the stdlib json module
+    ORJSON_AVAILABLE = False
+
+from ..data_classes import Fighter, Weapon, Armour, LearningParameters, PlayerInventory, PlayerState, StatModifiers
 from .ml_agent import MLAgent
 from .fighter_loader import FighterLoader
 from .player_state_builder import PlayerStateBuilder
 from .player_state_machine import StateMachine
+from ._hitbox_kernels import compute_hitbox, compute_attack_hitbox
+from ._stat_kernels import combine_stats
 from ..globals import Action, State
 from ..globals.constants import ARENA_WIDTH, SPAWN_MARGIN, GROUND_LEVEL
 
 logger = logging.getLogger(__name__)
 
+_ATTACK_ACTIVE = State.ATTACK_ACTIVE.value
+_JUMP = Action.JUMP.value
+
+def _restart_attack_cooldown(state: PlayerState):
+    state.attack_cooldown_remaining = state.attack_cooldown
+
+
+def _restart_block_cooldown(state: PlayerState):
+    state.block_cooldown_remaining = state.block_cooldown
+
+
+def _restart_jump_cooldown(state: PlayerState):
+    state.jump_cooldown_remaining = state.jump_cooldown
+
+
+# Cooldown restarted when a recovery state returns to IDLE
+_RECOVERY_COOLDOWNS = {
+    State.ATTACK_RECOVERY: _restart_attack_cooldown,
+    State.BLOCK_RECOVERY: _restart_block_cooldown,
+    State.JUMP_RECOVERY: _restart_jump_cooldown,
+}
+
+# PlayerState cooldown counter gating each action, indexed by Action value
+_COOLDOWN_FIELDS: Tuple[Optional[str], ...] = tuple(
+    {
+        Action.ATTACK: 'attack_cooldown_remaining',
+        Action.BLOCK: 'block_cooldown_remaining',
+        Action.JUMP: 'jump_cooldown_remaining',
+    }.get(action)
+    for action in sorted(Action, key=lambda a: a.value)
+)
+
+def _weapon_key(weapon: Optional[Weapon]) -> Optional[Tuple]:
+    """Hashable summary of the stat modifiers a weapon applies"""
+    if weapon is None:
+        return None
+    return (
+        weapon.gravity_modifier,
+        weapon.jump_force_modifier,
+        weapon.move_speed_modifier,
+        weapon.x_attack_range_modifier,
+        weapon.y_attack_range_modifier,
+        weapon.attack_damage_modifier,
+        weapon.attack_cooldown_modifier,
+        weapon.hit_stun_frames_modifier,
+        weapon.block_stun_frames_modifier
+    )
+
+
+def _armour_key(armour: Optional[Armour]) -> Optional[Tuple]:
+    """Hashable summary of the stat modifiers an armour piece applies"""
+    if armour is None:
+        return None
+    return (
+        armour.gravity_modifier,
+        armour.jump_force_modifier,
+        armour.move_speed_modifier,
+        armour.health_modifier,
+        armour.damage_reduction_modifier
+    )
+
+
+# Values used for Weapon/Armour fields a shop item leaves out
+_WEAPON_DEFAULTS = {
+    "name": None,
+    "gravity_modifier": 1.0,
+    "jump_force_modifier": 0,
+    "move_speed_modifier": 0,
+    "x_attack_range_modifier": 0,
+    "y_attack_range_modifier": 0,
+    "attack_damage_modifier": 0,
+    "attack_cooldown_modifier": 0,
+    "hit_stun_frames_modifier": 0,
+    "block_stun_frames_modifier": 0,
+    "rarity": "common",
+}
+_ARMOUR_DEFAULTS = {
+    "name": None,
+    "description": "",
+    "gravity_modifier": 1.0,
+    "jump_force_modifier": 0,
+    "move_speed_modifier": 0,
+    "health_modifier": 0,
+    "damage_reduction_modifier": 0,
+    "rarity": "common",
+}
+
+
+def _item_kwargs(item_data: Dict, defaults: Dict) -> Dict:
+    """Constructor kwargs for an item: the defaults' fields, overridden by item_data"""
+    kwargs = defaults.copy()
+    kwargs.update((key, item_data[key]) for key in defaults.keys() & item_data.keys())
+    return kwargs
+
+
+def _modifier_vectors(pairs) -> StatModifiers:
+    """Read-only StatModifiers from (stat name, multiplier, addend) triples"""
+    index = Fighter.STAT_INDEX
+    mul = np.ones(len(index))
+    add = np.zeros(len(index))
+    for name, scale, delta in pairs:
+        mul[index[name]] = scale
+        add[index[name]] = delta
+    mul.flags.writeable = False
+    add.flags.writeable = False
+    return StatModifiers(mul=mul, add=add)
+
+
+# Keys are the modifier values themselves, so cached entries never go stale
+# when items are bought or re-equipped. Weapons and armour are cached
+# separately and only combined when a fighter is built
+
+@lru_cache(maxsize=64)
+def _weapon_modifiers(weapon_key: Optional[Tuple]) -> StatModifiers:
+    """Stat modifier vectors for one weapon (identity for no weapon)"""
+    if weapon_key is None:
+        return _modifier_vectors(())
+    (gravity, jump_force, move_speed, x_range, y_range,
+     damage, cooldown, hit_stun, block_stun) = weapon_key
+    return _modifier_vectors((
+        ('gravity', gravity, 0.0),
+        ('jump_force', 1.0, jump_force),
+        ('move_speed', 1.0, move_speed),
+        ('x_attack_range', 1.0, x_range),
+        ('y_attack_range', 1.0, y_range),
+        ('attack_damage', 1.0, damage),
+        ('attack_cooldown', 1.0, cooldown),
+        ('on_hit_stun', 1.0, hit_stun),
+        ('on_block_stun', 1.0, block_stun),
+    ))
+
+
+@lru_cache(maxsize=64)
+def _armour_modifiers(armour_key: Optional[Tuple]) -> StatModifiers:
+    """Stat modifier vectors for one armour piece (identity for no armour)"""
+    if armour_key is None:
+        return _modifier_vectors(())
+    gravity, jump_force, move_speed, health, damage_reduction = armour_key
+    return _modifier_vectors((
+        ('gravity', gravity, 0.0),
+        ('jump_force', 1.0, jump_force),
+        ('move_speed', 1.0, move_speed),
+        ('health', 1.0, health),
+        ('damage_reduction', 1.0, damage_reduction),
+    ))
+
+
 class Player(MLAgent):
     """Player class managing fighter stats, items, and ML agent"""
+    
+    # With MLAgent's slots, Players carry no per-instance __dict__
+    __slots__ = (
+        'player_id', 'base_fighter', '_base_stats', '_fighter', '_fighter_dirty',
+        'gold', 'level', 'experience', 'inventory', '_reward_weights',
+        'base_learning_parameters', '_learning_deltas', '_pending_params', 'initial_feature_mask',
+        '_agent_get_action', 'state', 'state_machine', '_hitbox', '_attack_hitbox',
+        'total_reward', 'wins', 'losses', 'total_fights', 'batch_history', 'actions_taken',
+        '_win_rate', '_inv_total_fights',
+    )
+    
     def __init__(self, 
                  player_id: int, # 1 or 2
                  fighter_name: str = None,
@@ -30,8 +198,8 @@ class Player(MLAgent):
         # Player identification
         self.player_id = player_id
         
-        # Load fighter from configuration
-        FighterLoader.set_config_path('/Users/benrobson/Documents/Coding/Random Programs/MLFightingGame/MLFightingGame/core/players/fighters.json')
+        # Load fighter from configuration (FighterLoader caches the parsed
+        # config and built fighters process-wide)
         if fighter_name is None:
             fighter_name = "aggressive"  # Default fighter if none specified
 
@@ -39,7 +207,11 @@ class Player(MLAgent):
         
         # Fighter and stats
         self.base_fighter = fighter
-        self.fighter = self._create_modified_fighter(fighter, items)
+        # Base fighters are shared and never mutated, so gather their stats once
+        self._base_stats = fighter.stat_vector()
+        self._base_stats.flags.writeable = False
+        self._fighter = self._create_modified_fighter(fighter, items)
+        self._fighter_dirty = False  # Set by purchases, rebuilt on the next read of fighter
         
         # Resources
         self.gold = starting_gold
@@ -48,25 +220,31 @@ class Player(MLAgent):
         
         # Items and inventory
         self.inventory = items or PlayerInventory()
+        self._rebuild_reward_weights()
         
         # Learning parameters
         self.learning_parameters = learning_parameters or LearningParameters()
         self.base_learning_parameters = self.learning_parameters.copy()  # Store base parameters
         
+        # MLAgent.update_parameters kwargs queued until the next _flush_params
+        self._pending_params = {}
+        
         self.initial_feature_mask = initial_feature_mask
 
         # Initialize ML Agent with feature mask
         super().__init__(
             num_features=num_features,
             num_actions=num_actions,
-            epsilon=self.learning_parameters.epsilon,
-            epsilon_decay=self.learning_parameters.epsilon_decay,
-            epsilon_min=self.learning_parameters.epsilon_min,
             learning_rate=self.learning_parameters.learning_rate,
-            initial_feature_mask=self.initial_feature_mask  # Pass to parent
+            initial_feature_mask=self.initial_feature_mask,  # Pass to parent
+            learning_parameters=self.learning_parameters  # Shared, so epsilon needs no syncing
         )
         
         self._apply_learning_modifiers()
+        self._flush_params()
+        
+        # MLAgent.get_action bound once; get_action runs every decision
+        self._agent_get_action = super().get_action
 
         # Player state (managed by GameEngine)
         self.state = PlayerStateBuilder.build(
@@ -78,6 +256,10 @@ class Player(MLAgent):
 
         self.state_machine = StateMachine(self.state)
         
+        # Reused (x1, y1, x2, y2) buffers for the per-frame collision queries
+        self._hitbox = np.empty(4, dtype=np.float64)
+        self._attack_hitbox = np.empty(4, dtype=np.float64)
+        
         # Training metrics
         self.total_reward = 0
         self.wins = 0
@@ -85,6 +267,7 @@ class Player(MLAgent):
         self.total_fights = 0
         self.batch_history = []
         self.actions_taken = 0
+        self._refresh_fight_stats()
         
         logger.info(f"Player {player_id} initialized with fighter {fighter.name}")
     
@@ -103,151 +286,137 @@ class Player(MLAgent):
             self.state.x = self.state.start_x
         
     def _create_modified_fighter(self, base_fighter: Fighter, items: Optional[PlayerInventory]) -> Fighter:
-        """Create a fighter with stats modified by equipped items"""
+        """
+        Create a fighter with stats modified by equipped items
+        
+        Returns a new Fighter whenever items apply; base_fighter is FighterLoader's
+        shared copy and is never mutated.
+        """
         if not items:
             return base_fighter
             
-        # Start with base stats
-        modified_fighter = Fighter(
-            name=base_fighter.name,
-
-            width=base_fighter.width,
-            height=base_fighter.height,
-
-            gravity=base_fighter.gravity,
-            friction=base_fighter.friction,
-            jump_force=base_fighter.jump_force,
-            jump_cooldown=base_fighter.jump_cooldown,
-            move_speed=base_fighter.move_speed,
-
-            x_attack_range=base_fighter.x_attack_range,
-            y_attack_range=base_fighter.y_attack_range,
-            attack_damage=base_fighter.attack_damage,
-            attack_cooldown=base_fighter.attack_cooldown,
-            on_hit_stun=base_fighter.on_hit_stun,
-
-            block_efficiency=base_fighter.block_efficiency,
-            block_cooldown=base_fighter.block_cooldown,
-            on_block_stun=base_fighter.on_block_stun,
-
-            health=base_fighter.health,
-            damage_reduction=base_fighter.damage_reduction,
-
-            weapon=base_fighter.weapon,
-            frame_data=base_fighter.frame_data
-        )
-        
-        # Apply weapon modifiers
         weapon = items.get_equipped_weapon()
-        if weapon:
-            modified_fighter.gravity *= weapon.gravity_modifier
-            modified_fighter.jump_force += weapon.jump_force_modifier
-            modified_fighter.move_speed += weapon.move_speed_modifier
-            modified_fighter.x_attack_range += weapon.x_attack_range_modifier
-            modified_fighter.y_attack_range += weapon.y_attack_range_modifier
-            modified_fighter.attack_damage += weapon.attack_damage_modifier
-            modified_fighter.attack_cooldown += weapon.attack_cooldown_modifier
-            modified_fighter.on_hit_stun += weapon.hit_stun_frames_modifier
-            modified_fighter.on_block_stun += weapon.block_stun_frames_modifier
-            modified_fighter.weapon = weapon.name
-            
-        # Apply armour modifiers
         armour = items.get_equipped_armour()
-        if armour:
-            modified_fighter.gravity *= armour.gravity_modifier
-            modified_fighter.jump_force += armour.jump_force_modifier
-            modified_fighter.move_speed += armour.move_speed_modifier
-            modified_fighter.health += armour.health_modifier
-            modified_fighter.damage_reduction += armour.damage_reduction_modifier
-            
-        return modified_fighter
+        weapon_mods = _weapon_modifiers(_weapon_key(weapon))
+        armour_mods = _armour_modifiers(_armour_key(armour))
+        
+        # Apply weapon and armour to all modifiable stats in one fused pass
+        base_stats = self._base_stats if base_fighter is self.base_fighter else base_fighter.stat_vector()
+        stats = combine_stats(
+            np.empty_like(base_stats),
+            base_stats,
+            weapon_mods.mul,
+            weapon_mods.add,
+            armour_mods.mul,
+            armour_mods.add
+        )
+        return base_fighter.with_stats(
+            stats,
+            weapon=weapon.name if weapon else base_fighter.weapon,
+            armour=None
+        )
         
     def _apply_learning_modifiers(self):
-        """Apply all learning modifiers to parameters"""
+        """Rebuild learning parameters from the base values and every owned modifier"""
         # Reset to base values before applying modifiers
         self.learning_parameters = self.base_learning_parameters.copy()
+        self._learning_deltas = {}
         
-        # Apply all modifiers
-        for category, modifiers in self.inventory.learning_modifiers.items():
-            for modifier in modifiers:
-                delta = modifier.get("delta", 0)
-                self.learning_parameters.apply_modifier(category, delta)
-                
-        # Update ML agent parameters
-        super().update_parameters(
-            epsilon=self.learning_parameters.epsilon,
-            epsilon_decay=self.learning_parameters.epsilon_decay,
-            learning_rate=self.learning_parameters.learning_rate
-        )
+        # Apply all modifiers one at a time, clamping after each like _add_learning_modifier
+        for category, delta in self.inventory.learning_modifier_deltas:
+            self._learning_deltas[category] = self._learning_deltas.get(category, 0) + delta
+            self.learning_parameters.apply_modifier(category, delta)
+
+        self._queue_learning_parameters()
+
+    def _add_learning_modifier(self, category: str, delta: float):
+        """Apply a single newly bought modifier on top of the live parameters"""
+        self._learning_deltas[category] = self._learning_deltas.get(category, 0) + delta
+        self.learning_parameters.apply_modifier(category, delta)
+        self._queue_learning_parameters()
+
+    def _queue_learning_parameters(self):
+        """Queue the live learning rate for the ML agent's optimizer"""
+        # Epsilon and its schedule are read through the shared learning_parameters
+        self._pending_params['learning_rate'] = self.learning_parameters.learning_rate
+
+    def _flush_params(self):
+        """Push every queued parameter change to the ML agent in a single call"""
+        if self._pending_params:
+            pending, self._pending_params = self._pending_params, {}
+            super().update_parameters(**pending)
 
     def _update_feature_mask(self):
         """Update feature map in the ML agent"""
         if self.initial_feature_mask is not None:
-            self.feature_mask = self.initial_feature_mask.copy()
+            feature_mask = self.initial_feature_mask.copy()
         else:
             # Default to all features enabled
-            self.feature_mask = np.ones(self.num_features, dtype=bool)
+            feature_mask = np.ones(self.num_features, dtype=bool)
         
-        # Apply any feature modifiers from inventory
-        for feature in self.inventory.features:
-            if feature in self.feature_mask:
-                self.feature_mask[feature] = True
+        # Enable every feature unlocked through the inventory
+        if self.inventory.feature_indices:
+            unlocked = np.fromiter(self.inventory.feature_indices, dtype=np.intp)
+            feature_mask[unlocked] = True
         
-        super().update_parameters(feature_mask=self.feature_mask)
+        self._pending_params['feature_mask'] = feature_mask
+        self._flush_params()
 
     def get_hitbox(self) -> Tuple[float, float, float, float]:
         """Get current hitbox as (x1, y1, x2, y2)"""
-        return (
-            self.state.x - self.state.width / 2,
-            self.state.y - self.state.height / 2,
-            self.state.x + self.state.width / 2,
-            self.state.y + self.state.height / 2
-        )
+        return tuple(self.hitbox_view().tolist())
     
     def get_attack_hitbox(self) -> Optional[Tuple[float, float, float, float]]:
         """Get attack hitbox if currently attacking"""
-        if not self.state.current_state == State.ATTACK_ACTIVE:
-            return None
-        
-        # Determine attack direction based on facing
-        direction = 1 if self.state.facing_right else -1
-        attack_x_offset = self.state.width / 2 * direction
+        attack_hitbox = self.attack_hitbox_view()
+        return None if attack_hitbox is None else tuple(attack_hitbox.tolist())
+    
+    def hitbox_view(self) -> np.ndarray:
+        """
+        Current hitbox as an (x1, y1, x2, y2) array for per-frame collision checks
         
-        # Calculate start and end points
-        attack_start_x = self.state.x + attack_x_offset
-        attack_end_x = attack_start_x + (self.state.x_attack_range * direction)
+        Returns this player's reused buffer, overwritten on the next call, so
+        treat it as read-only and copy it if it must outlive the frame.
+        """
+        state = self.state
+        return compute_hitbox(self._hitbox, state.x, state.y, state.width, state.height)
+    
+    def attack_hitbox_view(self) -> Optional[np.ndarray]:
+        """
+        Attack hitbox as an (x1, y1, x2, y2) array, or None if not attacking
         
-        # Ensure x1 < x2 by using min/max
-        x1 = min(attack_start_x, attack_end_x)
-        x2 = max(attack_start_x, attack_end_x)
+        Returns this player's reused buffer, overwritten on the next call, so
+        treat it as read-only and copy it if it must outlive the frame.
+        """
+        state = self.state
+        if state.current_state_value != _ATTACK_ACTIVE:
+            return None
         
-        return (
-            x1,
-            self.state.y - self.state.y_attack_range / 2,
-            x2,
-            self.state.y + self.state.y_attack_range / 2
+        return compute_attack_hitbox(
+            self._attack_hitbox,
+            state.x,
+            state.y,
+            state.width,
+            state.facing_right,
+            state.x_attack_range,
+            state.y_attack_range
         )
 
     def can_take_action(self) -> bool:
         """Check if player can take a new action"""
-        actionable_states = self.state_machine.actionable_states
-        return self.state.current_state in actionable_states
+        return (self.state_machine.actionable_mask >> self.state.current_state_value) & 1 == 1
 
-    def is_action_off_cooldown(self, action: Action) -> bool:
-        """Check if a specific action is off cooldown"""
-        if action == Action.ATTACK and self.state.attack_cooldown_remaining > 0:
-            return False
-        
-        if action == Action.BLOCK and self.state.block_cooldown_remaining > 0:
-            return False
-        
-        if action == Action.JUMP and self.state.y < 0:
-            return False
+    def is_action_off_cooldown(self, action: int) -> bool:
+        """Check if a specific action index is off cooldown"""
+        cooldown_field = _COOLDOWN_FIELDS[action]
+        if cooldown_field is None:
+            return True
         
-        if action == Action.JUMP and self.state.jump_cooldown_remaining > 0:
+        if getattr(self.state, cooldown_field) > 0:
             return False
         
-        return True
+        # Jumping additionally needs the player to not be above the arena top
+        return action != _JUMP or self.state.y >= 0
         
     def add_item(self, item_id: str, item_data: Dict):
         """Add an item to the player's inventory from shop purchase"""
@@ -255,78 +424,92 @@ class Player(MLAgent):
         
         logger.info(f"Player {self.player_id} adding item {item_id} of category {category}")
         
-        if category == "weapons":
-            weapon = Weapon(
-                name=item_data.get("name"),
-                gravity_modifier=item_data.get("gravity_modifier", 1.0),
-                jump_force_modifier=item_data.get("jump_force_modifier", 0),
-                move_speed_modifier=item_data.get("move_speed_modifier", 0),
-                x_attack_range_modifier=item_data.get("x_attack_range_modifier", 0),
-                y_attack_range_modifier=item_data.get("y_attack_range_modifier", 0),
-                attack_damage_modifier=item_data.get("attack_damage_modifier", 0),
-                attack_cooldown_modifier=item_data.get("attack_cooldown_modifier", 0),
-                hit_stun_frames_modifier=item_data.get("hit_stun_frames_modifier", 0),
-                block_stun_frames_modifier=item_data.get("block_stun_frames_modifier", 0),
-                rarity=item_data.get("rarity", "common")
-            )
-            self.inventory.add_weapon(weapon)
-            self._update_fighter_stats()
-            logger.info(f"Added weapon {weapon.name}, now have {len(self.inventory.weapons)} weapons")
-            
-        elif category == "armour":
-            armour = Armour(
-                name=item_data.get("name"),
-                description=item_data.get("description", ""),
-                gravity_modifier=item_data.get("gravity_modifier", 1.0),
-                jump_force_modifier=item_data.get("jump_force_modifier", 0),
-                move_speed_modifier=item_data.get("move_speed_modifier", 0),
-                health_modifier=item_data.get("health_modifier", 0),
-                damage_reduction_modifier=item_data.get("damage_reduction_modifier", 0),
-                rarity=item_data.get("rarity", "common")
-            )
-            self.inventory.add_armour(armour)
-            self._update_fighter_stats()
-            logger.info(f"Added armour {armour.name}, now have {len(self.inventory.armour)} armour pieces")
-            
-        elif category == "reward_modifiers":
-            subcategory = item_data.get("subcategory")
-            self.inventory.add_reward_modifier(subcategory, item_data)
-            logger.info(f"Added reward modifier for {subcategory}")
+        handler = self._CATEGORY_HANDLERS.get(category)
+        if handler is None:
+            logger.warning(f"Unknown item category: {category}")
+        else:
+            handler(self, item_id, item_data)
+        
+        self._flush_params()
+        logger.info(f"Player {self.player_id} inventory updated with item: {item_id}")
+
+    def add_weapon_item(self, weapon: Weapon):
+        """Store and auto-equip an already built weapon, skipping dict parsing"""
+        if self.inventory.add_weapon(weapon):
+            self._fighter_dirty = True  # Only the equipped weapon affects stats
+        logger.info(f"Added weapon {weapon.name}, now have {len(self.inventory.weapons)} weapons")
+
+    def add_armour_item(self, armour: Armour):
+        """Store and auto-equip an already built armour piece, skipping dict parsing"""
+        if self.inventory.add_armour(armour):
+            self._fighter_dirty = True  # Only the equipped armour affects stats
+        logger.info(f"Added armour {armour.name}, now have {len(self.inventory.armour)} armour pieces")
+
+    def _add_weapon_item(self, item_id: str, item_data: Dict):
+        """Build a purchased weapon from its shop dict and add it"""
+        self.add_weapon_item(Weapon(**_item_kwargs(item_data, _WEAPON_DEFAULTS)))
+
+    def _add_armour_item(self, item_id: str, item_data: Dict):
+        """Build a purchased armour piece from its shop dict and add it"""
+        self.add_armour_item(Armour(**_item_kwargs(item_data, _ARMOUR_DEFAULTS)))
+
+    def _add_reward_modifier_item(self, item_id: str, item_data: Dict):
+        """Store a purchased reward modifier and update the reward weights"""
+        subcategory = item_data.get("subcategory")
+        self.inventory.add_reward_modifier(subcategory, item_data)
+        self._add_reward_weight(subcategory, item_data.get("delta", 0))
+        logger.info(f"Added reward modifier for {subcategory}")
+
+    def _add_learning_modifier_item(self, item_id: str, item_data: Dict):
+        """Store a purchased learning modifier and apply it"""
+        subcategory = item_data.get("subcategory")
+        self.inventory.add_learning_modifier(subcategory, item_data)
+        self._add_learning_modifier(subcategory, item_data.get("delta", 0))
+        logger.info(f"Added learning modifier for {subcategory}")
+
+    def _add_feature_item(self, item_id: str, item_data: Dict):
+        """Unlock a purchased state vector feature"""
+        # Extract feature index from item data
+        feature_properties = item_data.get("properties", {})
+        feature_index = feature_properties.get("feature_index")
+        feature_name = item_data.get("name", f"feature_{feature_index}")
+        
+        if feature_index is not None and feature_index < self.num_features:
+            # Update feature mask to enable this feature (CPU copy, no device sync)
+            current_mask = self._pending_params.get('feature_mask', self._cpu_feature_mask).copy()
+            current_mask[feature_index] = 1
             
-        elif category == "learning_modifiers":
-            subcategory = item_data.get("subcategory")
-            self.inventory.add_learning_modifier(subcategory, item_data)
-            self._apply_learning_modifiers()
-            logger.info(f"Added learning modifier for {subcategory}")
+            # Queue ML agent's feature mask update
+            self._pending_params['feature_mask'] = current_mask
             
-        elif category == "features":
-            # Extract feature index from item data
-            feature_properties = item_data.get("properties", {})
-            feature_index = feature_properties.get("feature_index")
-            feature_name = item_data.get("name", f"feature_{feature_index}")
+            # Add to inventory for tracking
+            self.inventory.add_feature(feature_name, feature_index)
             
-            if feature_index is not None and feature_index < self.num_features:
-                # Update feature mask to enable this feature
-                current_mask = self.feature_mask.cpu().numpy()
-                current_mask[feature_index] = 1
-                
-                # Update ML agent's feature mask
-                super().update_parameters(feature_mask=current_mask)
-                
-                # Add to inventory for tracking
-                self.inventory.add_feature(feature_name)
-                
-                logger.info(f"Player {self.player_id} unlocked feature {feature_index}: {feature_name}")
-            else:
-                logger.warning(f"Invalid feature index {feature_index} in item {item_id}")
+            logger.info(f"Player {self.player_id} unlocked feature {feature_index}: {feature_name}")
         else:
-            logger.warning(f"Unknown item category: {category}")
-        
-        logger.info(f"Player {self.player_id} inventory updated with item: {item_id}")
+            logger.warning(f"Invalid feature index {feature_index} in item {item_id}")
+
+    # Handler for each shop item category, called as handler(self, item_id, item_data)
+    _CATEGORY_HANDLERS: ClassVar[Dict[str, Callable[['Player', str, Dict], None]]] = {
+        "weapons": _add_weapon_item,
+        "armour": _add_armour_item,
+        "reward_modifiers": _add_reward_modifier_item,
+        "learning_modifiers": _add_learning_modifier_item,
+        "features": _add_feature_item,
+    }
+
+    @property
+    def fighter(self) -> Fighter:
+        """Fighter with equipped item modifiers applied, rebuilt lazily after purchases"""
+        if self._fighter_dirty:
+            self._update_fighter_stats()
+        return self._fighter
 
     def _update_fighter_stats(self):
         """Recalculate fighter stats based on current items"""
-        self.fighter = self._create_modified_fighter(self.base_fighter, self.inventory)
+        # A fresh Fighter each time: fighters already handed out keep their stats
+        self._fighter = self._create_modified_fighter(self.base_fighter, self.inventory)
+        self._fighter_dirty = False
         
     def get_action(self, state_vector: np.ndarray, available_actions: Optional[List[int]] = None) -> int:
         """
@@ -343,30 +526,51 @@ class Player(MLAgent):
         ## return Action.JUMP  # Test that the game works without the ML logic
 
         # Get action from ML agent
-        action = super().get_action(
-            state_vector, 
-            available_actions, 
-            epsilon=self.learning_parameters.epsilon
-        )
+        params = self.learning_parameters
+        eps = params.epsilon
+        action = self._agent_get_action(state_vector, available_actions, epsilon=eps)
 
-        action = Action(action)  # Ensure action is an Action enum
-        
         # Decay epsilon after each action
-        self.learning_parameters.epsilon = max(
-            self.learning_parameters.epsilon_min,
-            self.learning_parameters.epsilon * self.learning_parameters.epsilon_decay
-        )
-        
-        # Update ML agent's epsilon
-        super().update_parameters(epsilon=self.learning_parameters.epsilon)
+        eps *= params.epsilon_decay
+        eps_min = params.epsilon_min
+        params.epsilon = eps_min if eps < eps_min else eps
         
         # Track actions taken
         self.actions_taken += 1
         
         return action
 
-    def request_action(self, action: Action):
-        if self.state_machine.can_transition(self.state.current_state, action):
+    def get_actions_batch(self,
+                          states: np.ndarray,
+                          action_masks: Optional[np.ndarray] = None,
+                          epsilon: Optional[float] = None) -> np.ndarray:
+        """
+        Get actions for several lockstep fights with one forward pass and decay epsilon
+
+        Every row explores with the current epsilon, which is then decayed once
+        per row in a single step, as if get_action had been called for each.
+
+        Args:
+            states: State vectors, shape (B, num_features)
+            action_masks: Boolean mask of valid actions, shape (B, num_actions)
+            epsilon: Override epsilon for this batch (if None, use the current value)
+
+        Returns:
+            Selected action indices, shape (B,)
+        """
+        params = self.learning_parameters
+        eps = params.epsilon if epsilon is None else epsilon
+        actions = super().get_actions_batch(states, action_masks, epsilon=eps)
+
+        count = len(actions)
+        eps = params.epsilon * params.epsilon_decay ** count
+        params.epsilon = eps if eps > params.epsilon_min else params.epsilon_min
+        self.actions_taken += count
+
+        return actions
+
+    def request_action(self, action: int):
+        if self.state_machine.can_act(self.state.current_state_value, action):
             new_state = self.state_machine.get_next_state(self.state, self.state.current_state, action)
             self._enter_state(new_state)
     
@@ -379,33 +583,23 @@ class Player(MLAgent):
     
     def _enter_state(self, new_state: State):
         """Apply state effects when entering a new state"""
-        previous_state = self.state.current_state
+        state = self.state
+        previous_state = state.current_state
         
         # Update state
-        self.state.current_state = new_state
-        self.state.state_frame_counter = 0
+        state.set_current_state(new_state)
+        state.state_frame_counter = 0
         
         # Apply state effects
-        effects = self.state_machine.get_state_effects(new_state)
-        for effect, value in effects.items():
-            if value == 'negative_move_speed':
-                self.state.velocity_x = -self.state.move_speed
-            elif value == 'positive_move_speed':
-                self.state.velocity_x = self.state.move_speed
-            elif value == 'negative_jump_force':
-                self.state.velocity_y = -self.state.jump_force
-            else:
-                setattr(self.state, effect, value)
+        apply_effects = self.state_machine.effect_fns[new_state.value]
+        if apply_effects is not None:
+            apply_effects(state)
 
         # Handle cooldowns when actions complete
-        if previous_state in [State.ATTACK_RECOVERY, State.BLOCK_RECOVERY, State.JUMP_RECOVERY]:
-            if new_state == State.IDLE:
-                if previous_state == State.ATTACK_RECOVERY:
-                    self.state.attack_cooldown_remaining = self.state.attack_cooldown
-                elif previous_state == State.BLOCK_RECOVERY:
-                    self.state.block_cooldown_remaining = self.state.block_cooldown
-                elif previous_state == State.JUMP_RECOVERY:
-                    self.state.jump_cooldown_remaining = self.state.jump_cooldown
+        if new_state is State.IDLE:
+            restart_cooldown = _RECOVERY_COOLDOWNS.get(previous_state)
+            if restart_cooldown is not None:
+                restart_cooldown(state)
             
     def update(self, 
                state: np.ndarray, 
@@ -421,20 +615,21 @@ class Player(MLAgent):
         Get reward weights for each reward event type
         
         Returns:
-            Dictionary mapping reward event names to their weights
+            Dictionary mapping reward event names to their weights. This is the
+            cached dict itself, rebuilt only when reward modifiers change
         """
-        # Default weights (1.0 = no modification)
+        return self._reward_weights
+    
+    def _rebuild_reward_weights(self):
+        """Sum every owned reward modifier's delta into its event's weight"""
         weights = {}
-        
-        # Apply modifiers from items
         for category, modifiers in self.inventory.reward_modifiers.items():
-            if category in weights:
-                for modifier in modifiers:
-                    delta = modifier.get("delta", 0)
-                    # Add modifier delta to existing weight
-                    weights[category] = delta
-                    
-        return weights
+            weights[category] = sum(modifier.get("delta", 0) for modifier in modifiers)
+        self._reward_weights = weights
+
+    def _add_reward_weight(self, category: str, delta: float):
+        """Fold a single newly bought reward modifier into the cached weights"""
+        self._reward_weights[category] = self._reward_weights.get(category, 0) + delta
         
     def spend_gold(self, amount: int) -> bool:
         """Spend gold if available"""
@@ -465,6 +660,7 @@ class Player(MLAgent):
         
         # Update total fights
         self.total_fights = self.wins + self.losses
+        self._refresh_fight_stats()
         
         # Log the batch results
         logger.info(f"Player {self.fighter.name} batch complete: "
@@ -482,10 +678,19 @@ class Player(MLAgent):
                 'losses': losses,
                 'win_rate': wins / (wins + losses) if (wins + losses) > 0 else 0
             })
+        
+        self._flush_params()
 
             
+    def _refresh_fight_stats(self):
+        """Recompute cached win rate and 1/total_fights; call after changing wins, losses or total_fights"""
+        inv_total_fights = 1.0 / max(1, self.total_fights)
+        self._inv_total_fights = inv_total_fights
+        self._win_rate = self.wins * inv_total_fights
+
     def get_stats(self) -> Dict:
         """Get player statistics"""
+        params = self.learning_parameters
         return {
             "player_id": self.player_id,
             "level": self.level,
@@ -494,13 +699,13 @@ class Player(MLAgent):
             "total_fights": self.total_fights,
             "wins": self.wins,
             "losses": self.losses,
-            "win_rate": self.wins / max(1, self.total_fights),
-            "average_reward": self.total_reward / max(1, self.total_fights),
-            "fighter_name": self.fighter.name,
+            "win_rate": self._win_rate,
+            "average_reward": self.total_reward * self._inv_total_fights,
+            "fighter_name": self.base_fighter.name,  # Same name, without forcing a pending fighter rebuild
             "items_owned": len(self.inventory.weapons) + len(self.inventory.armour),
-            "learning_params": self.learning_parameters.to_dict(),
+            "learning_params": params.to_dict(),
             "actions_taken": self.actions_taken,
-            "current_epsilon": self.learning_parameters.epsilon
+            "current_epsilon": params.epsilon
         }
         
     def save(self, filepath: str):
@@ -527,63 +732,75 @@ class Player(MLAgent):
         player_file = Path(filepath)
         player_file.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(player_file, 'w') as f:
-            json.dump(save_data, f, indent=2)
+        if ORJSON_AVAILABLE:
+            player_file.write_bytes(orjson.dumps(
+                save_data,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            ))
+        else:
+            with open(player_file, 'w') as f:
+                json.dump(save_data, f, indent=2)
             
         # Save ML agent weights
-        weights_file = player_file.with_suffix('.pth')
-        self.save_weights(str(weights_file))
+        self._flush_params()
+        self.save_weights(self._weights_path(filepath))
         
         logger.info(f"Player {self.player_id} saved to {filepath}")
         
+    @staticmethod
+    def _weights_path(filepath) -> str:
+        """Network checkpoint saved next to a player JSON (same name, .pth suffix)"""
+        filepath = str(filepath)
+        if filepath.endswith('.json'):
+            return filepath[:-5] + '.pth'
+        return str(Path(filepath).with_suffix('.pth'))
+        
     @classmethod
-    def load(cls, filepath: str, fighter_class) -> 'Player':
-        """Load player data from file"""
-        with open(filepath, 'r') as f:
-            data = json.load(f)
-            
-        # Recreate fighter
-        fighter = fighter_class(
-            name=data["base_fighter"]["name"],
-            gravity=data["base_fighter"]["gravity"],
-            jump_force=data["base_fighter"]["jump_force"],
-            move_speed=data["base_fighter"]["move_speed"],
-            x_attack_range=data["base_fighter"]["x_attack_range"],
-            y_attack_range=data["base_fighter"]["y_attack_range"],
-            attack_damage=data["base_fighter"]["attack_damage"],
-            attack_cooldown=data["base_fighter"]["attack_cooldown"],
-            health=data["base_fighter"]["health"],
-            weapon=data["base_fighter"]["weapon"]
-        )
+    def load(cls, filepath: str, fighter_class=None) -> 'Player':
+        """
+        Load player data from file
+        
+        Args:
+            filepath: Player JSON written by save
+            fighter_class: Unused; kept for existing callers. The base fighter is
+                           rebuilt by name through FighterLoader
+        """
+        if ORJSON_AVAILABLE:
+            data = orjson.loads(Path(filepath).read_bytes())
+        else:
+            with open(filepath, 'r') as f:
+                data = json.load(f)
         
         # Recreate learning parameters
         learning_params = LearningParameters(**data["learning_parameters"])
         
-        # Create player
+        # Create player (save stores the base fighter by name)
         player = cls(
             player_id=data["player_id"],
-            fighter=fighter,
+            fighter_name=data["base_fighter"],
             starting_gold=data["gold"],
             starting_level=data["level"],
             learning_parameters=learning_params
         )
         
         # Restore stats
+        stats = data["stats"]
         player.experience = data["experience"]
-        player.total_fights = data["stats"]["total_fights"]
-        player.batch_history = data["stats"]["batch_history"]
-        player.wins = data["stats"]["wins"]
-        player.losses = data["stats"]["losses"]
-        player.total_reward = data["stats"]["total_reward"]
-        player.actions_taken = data["stats"].get("actions_taken", 0)
+        player.total_fights = stats["total_fights"]
+        player.batch_history = stats["batch_history"]
+        player.wins = stats["wins"]
+        player.losses = stats["losses"]
+        player.total_reward = stats["total_reward"]
+        player.actions_taken = stats.get("actions_taken", 0)
+        player._refresh_fight_stats()
         
         # TODO: Properly restore inventory items
         # This requires recreating Weapon/Armour objects from saved data
         
         # Load ML agent weights
-        weights_file = Path(filepath).with_suffix('.pth')
-        if weights_file.exists():
-            player.load_weights(str(weights_file))
+        weights_file = cls._weights_path(filepath)
+        if os.path.exists(weights_file):
+            player.load_weights(weights_file)
             
         logger.info(f"Player {data['player_id']} loaded from {filepath}")
         return player
\ No newline at end of file
@@ -27,15 +27,8 @@ class PlayerStateBuilder:
         # Load fighter data based on player's fighter type
         fighter = player.fighter
         
-        # Build frame data dictionary from fighter's frame data
-        frame_data = {}
-        for action in Action:
-            action_data = fighter.get_action_data(action)
-            frame_data[action] = [
-                action_data.startup_frames,
-                action_data.active_frames,
-                action_data.recovery_frames
-            ]
+        # Built once per fighter's frame data and shared by every spawn
+        frame_data = fighter.frame_data_table
         
         # Determine facing direction based on player_id
         facing_right = (player_id == 1)
@@ -82,7 +75,7 @@ class PlayerStateBuilder:
             block_efficiency=float(fighter.block_efficiency),
             
             # Set state
-            current_state=State.IDLE,
+            current_state_value=State.IDLE.value,
             state_frame_counter=0,
             
             # Status flags
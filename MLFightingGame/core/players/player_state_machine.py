@@ -14,6 +14,19 @@ class StateMachine:
             State.JUMP_FALLING
         ]
         self.transitions = self._setup_transitions()
+        
+        # Bitmasks over State values: actionable states, and per Action value
+        # the states that accept that input
+        self.actionable_mask = sum(1 << state.value for state in self.actionable_states)
+        self.action_masks = [0] * len(Action)
+        for (state, event) in self.transitions:
+            if isinstance(event, Action):
+                self.action_masks[event.value] |= 1 << state.value
+        
+        # Entry effects compiled once per State, indexed by State value
+        self.effect_fns = [None] * (max(state.value for state in State) + 1)
+        for state in State:
+            self.effect_fns[state.value] = self._compile_effects(state)
     
     def _setup_transitions(self) -> dict:
         """Set up state transitions"""
@@ -116,6 +129,10 @@ class StateMachine:
         """Check if a transition is allowed"""
         return (current_state, action) in self.transitions
     
+    def can_act(self, state_value: int, action: int) -> bool:
+        """can_transition for an input action index, given the current State's value"""
+        return (self.action_masks[action] >> state_value) & 1 == 1
+    
     def get_next_state(self, player_state: PlayerState, current_state: State, event) -> State:
         """Get the next state based on current state and event"""
         if (current_state, event) in self.transitions:
@@ -163,6 +180,36 @@ class StateMachine:
             return True, 'stun_over' # Gets handled by smart return 
         return False, None
     
+    # Symbolic effect values and the PlayerState expression each stands for
+    _EFFECT_EXPRESSIONS = {
+        'negative_move_speed': '-state.move_speed',
+        'positive_move_speed': 'state.move_speed',
+        'negative_jump_force': '-state.jump_force',
+    }
+    
+    def _compile_effects(self, new_state: State):
+        """
+        Turn get_state_effects(new_state) into one straight-line function
+        
+        The generated function assigns every effect directly, so entering a
+        state costs one call instead of a dict walk with string compares.
+        Returns None for states without effects.
+        """
+        effects = self.get_state_effects(new_state)
+        if not effects:
+            return None
+        
+        lines = ["def apply_effects(state):"]
+        for effect, value in effects.items():
+            if isinstance(value, str):
+                lines.append(f"    state.{effect} = {self._EFFECT_EXPRESSIONS[value]}")
+            else:
+                lines.append(f"    state.{effect} = {value!r}")
+        
+        namespace = {}
+        exec("\n".join(lines), namespace)
+        return namespace['apply_effects']
+    
     def get_state_effects(self, new_state: State) -> dict:
         """Get the effects that should be applied when entering a state"""
         effects = {}
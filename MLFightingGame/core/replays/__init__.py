@@ -1,5 +1,7 @@
+from .replay_arena import ReplayArena
 from .replay_recorder import ReplayRecorder
 
 __all__ = [
+    "ReplayArena",
     "ReplayRecorder"
 ]
\ No newline at end of file
@@ -0,0 +1,71 @@
+import logging
+from typing import Optional
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Raw per-player values captured each recorded frame
+PLAYER_FRAME_DTYPE = np.dtype([
+    ("x", "f8"),
+    ("y", "f8"),
+    ("h", "f8"),    # health
+    ("vx", "f8"),   # velocity_x
+    ("vy", "f8"),   # velocity_y
+    ("fr", "?"),    # facing_right
+    ("s", "i4"),    # current_state (State value)
+    ("sf", "i4"),   # state_frame_counter
+    ("g", "?"),     # is_grounded
+    ("ac", "i4"),   # attack_cooldown_remaining
+    ("bc", "i4"),   # block_cooldown_remaining
+    ("jc", "i4"),   # jump_cooldown_remaining
+    ("st", "i4"),   # stun_frames_remaining
+])
+
+# One recorded frame: frame number plus both players
+REPLAY_FRAME_DTYPE = np.dtype([
+    ("f", "i4"),
+    ("p1", PLAYER_FRAME_DTYPE),
+    ("p2", PLAYER_FRAME_DTYPE),
+])
+
+
+class ReplayArena:
+    """Single backing allocation shared by every replay recorded in a batch"""
+
+    ALIGNMENT = 64
+
+    def __init__(self, capacity_bytes: int):
+        self.capacity_bytes = max(0, capacity_bytes)
+        # Uninitialised backing memory, allocated on the first frame buffer request
+        self._buffer: Optional[np.ndarray] = None
+        self._offset = 0
+
+    @classmethod
+    def for_replays(cls, num_replays: int, frames_per_replay: int) -> 'ReplayArena':
+        """Create an arena large enough for num_replays full-length replays"""
+        per_replay = frames_per_replay * REPLAY_FRAME_DTYPE.itemsize + cls.ALIGNMENT
+        return cls(max(0, num_replays) * per_replay)
+
+    @property
+    def bytes_used(self) -> int:
+        return self._offset
+
+    def alloc_frame_buffer(self, n_frames: int, dtype: np.dtype = REPLAY_FRAME_DTYPE) -> np.ndarray:
+        """
+        Carve a frame buffer out of the arena
+
+        Falls back to a standalone array if the arena is exhausted, since the
+        backing memory cannot grow while views into it are alive.
+        """
+        dtype = np.dtype(dtype)
+        start = -(-self._offset // self.ALIGNMENT) * self.ALIGNMENT
+        end = start + n_frames * dtype.itemsize
+
+        if end > self.capacity_bytes:
+            logger.debug(f"Replay arena exhausted ({self._offset}/{self.capacity_bytes} bytes), allocating separately")
+            return np.empty(n_frames, dtype=dtype)
+
+        if self._buffer is None:
+            self._buffer = np.empty(self.capacity_bytes, dtype=np.uint8)
+        self._offset = end
+        return np.frombuffer(self._buffer, dtype=dtype, count=n_frames, offset=start)
@@ -4,26 +4,36 @@ import os
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Optional
+import numpy as np
 from ..game_loop.game_state import GameState
+from ..globals.states import State
+from .replay_arena import ReplayArena, REPLAY_FRAME_DTYPE
 
 class ReplayRecorder:
     """Handles recording and saving fight replays"""
     
     def __init__(self):
-        self.frames: List[Dict[str, Any]] = []
         self.metadata: Dict[str, Any] = {}
         self.start_time: Optional[float] = None
         self.end_time: Optional[float] = None
         self.replay_directory = Path("replays")
-        self.previous_frame_data: Optional[Dict[str, Any]] = None  # NEW: Store previous frame for delta compression
+        self.arena: Optional[ReplayArena] = None
+        self._frame_buffer: Optional[np.ndarray] = None
+        self._frame_count = 0
+        self._frames_cache: Optional[List[Dict[str, Any]]] = None
         
         # Create replays directory if it doesn't exist
         self.replay_directory.mkdir(exist_ok=True, parents=True)
+
+    def bind_arena(self, arena: Optional[ReplayArena]):
+        """Allocate future frame buffers from a shared arena instead of the heap"""
+        self.arena = arena
     
     def start_recording(self, game_state: GameState):
         """Start recording a new fight"""
-        self.frames = []
-        self.previous_frame_data = None  # NEW: Reset previous frame data
+        self._frame_buffer = self._alloc_frames(game_state.max_frames)
+        self._frame_count = 0
+        self._frames_cache = None
         self.start_time = time.time()
         
         # Initialize metadata with shorter property names
@@ -37,66 +47,92 @@ class ReplayRecorder:
             "p1": game_state.get_player(1).fighter_name,  # player1_fighter
             "p2": game_state.get_player(2).fighter_name,  # player2_fighter
         }
+
+    def _alloc_frames(self, n_frames: int) -> np.ndarray:
+        """Allocate a raw frame buffer, from the bound arena if there is one"""
+        if self.arena is not None:
+            return self.arena.alloc_frame_buffer(n_frames, REPLAY_FRAME_DTYPE)
+        return np.empty(n_frames, dtype=REPLAY_FRAME_DTYPE)
     
     def record_frame(self, game_state: GameState, frame_counter: int):
-        """Record the current frame's state with delta compression"""
+        """Record the current frame's raw state (delta compression is deferred to frames)"""
+        if self._frame_buffer is None:
+            self._frame_buffer = self._alloc_frames(game_state.max_frames)
+        elif self._frame_count >= len(self._frame_buffer):
+            # Fight ran past max_frames - move to a larger standalone buffer
+            grown = np.empty(max(1, 2 * len(self._frame_buffer)), dtype=REPLAY_FRAME_DTYPE)
+            grown[:self._frame_count] = self._frame_buffer[:self._frame_count]
+            self._frame_buffer = grown
         
-        # Build current frame data
-        current_frame_data = {
-            "f": frame_counter,  # frame
-            "p": {}  # players
-        }
-        
-        # Collect current player data
-        for player_id in [1, 2]:
-            player_state = game_state.get_player(player_id)
-            
-            current_frame_data["p"][player_id] = {
-                "x": round(player_state.x, 2),
-                "y": round(player_state.y, 2),
-                "h": player_state.health,                         # health
-                "vx": round(player_state.velocity_x, 2),          # velocity_x
-                "vy": round(player_state.velocity_y, 2),          # velocity_y
-                "fr": player_state.facing_right,                  # facing_right
-                "s": player_state.current_state.name,             # current_state
-                "sf": player_state.state_frame_counter,           # state_frame_counter
-                "g": player_state.is_grounded,                    # is_grounded
-                "ac": player_state.attack_cooldown_remaining,     # attack_cooldown_remaining
-                "bc": player_state.block_cooldown_remaining,      # block_cooldown_remaining
-                "jc": player_state.jump_cooldown_remaining,       # jump_cooldown_remaining
-                "st": player_state.stun_frames_remaining,         # stun_frames_remaining
-            }
+        p1 = game_state.get_player(1)
+        p2 = game_state.get_player(2)
+        self._frame_buffer[self._frame_count] = (frame_counter, *[
+            (p.x, p.y, p.health, p.velocity_x, p.velocity_y, p.facing_right,
+             p.current_state.value, p.state_frame_counter, p.is_grounded,
+             p.attack_cooldown_remaining, p.block_cooldown_remaining,
+             p.jump_cooldown_remaining, p.stun_frames_remaining)
+            for p in (p1, p2)
+        ])
+        self._frame_count += 1
+        self._frames_cache = None
+
+    @property
+    def frames(self) -> List[Dict[str, Any]]:
+        """Recorded frames in the delta-compressed replay format"""
+        if self._frames_cache is None:
+            self._frames_cache = self._build_frames()
+        return self._frames_cache
+
+    def _build_frames(self) -> List[Dict[str, Any]]:
+        """Expand the raw frame buffer into delta-compressed frame dicts"""
+        frames = []
+        previous_players = {}
+        if self._frame_buffer is None:
+            return frames
         
-        # Apply delta compression
-        if self.previous_frame_data is None:
-            # First frame - store everything
-            compressed_frame = current_frame_data
-        else:
-            # Subsequent frames - only store differences
+        for row in self._frame_buffer[:self._frame_count].tolist():
+            frame_counter, *players = row
             compressed_frame = {
-                "f": frame_counter,
-                "p": {}
+                "f": frame_counter,  # frame
+                "p": {}  # players
             }
             
-            for player_id in [1, 2]:
-                current_player = current_frame_data["p"][player_id]
-                previous_player = self.previous_frame_data["p"].get(player_id, {})
+            for player_id, values in zip((1, 2), players):
+                x, y, h, vx, vy, fr, s, sf, g, ac, bc, jc, st = values
+                current_player = {
+                    "x": round(x, 2),
+                    "y": round(y, 2),
+                    "h": h,                 # health
+                    "vx": round(vx, 2),     # velocity_x
+                    "vy": round(vy, 2),     # velocity_y
+                    "fr": fr,               # facing_right
+                    "s": State(s).name,     # current_state
+                    "sf": sf,               # state_frame_counter
+                    "g": g,                 # is_grounded
+                    "ac": ac,               # attack_cooldown_remaining
+                    "bc": bc,               # block_cooldown_remaining
+                    "jc": jc,               # jump_cooldown_remaining
+                    "st": st,               # stun_frames_remaining
+                }
                 
-                # Find differences
-                player_diff = {}
-                for key, value in current_player.items():
-                    if key not in previous_player or previous_player[key] != value:
-                        player_diff[key] = value
+                # First frame stores everything, subsequent frames only store differences
+                previous_player = previous_players.get(player_id)
+                if previous_player is None:
+                    player_diff = current_player
+                else:
+                    player_diff = {
+                        key: value for key, value in current_player.items()
+                        if previous_player[key] != value
+                    }
                 
                 # Only include player data if there are changes
                 if player_diff:
                     compressed_frame["p"][player_id] = player_diff
+                previous_players[player_id] = current_player
+            
+            frames.append(compressed_frame)
         
-        # Store the compressed frame
-        self.frames.append(compressed_frame)
-        
-        # Update previous frame data for next comparison
-        self.previous_frame_data = current_frame_data
+        return frames
     
     def save_replay(self, winner: int = 0):
         """Save the recorded replay to a file"""
@@ -131,4 +167,33 @@ class ReplayRecorder:
             json.dump(replay_data, f, separators=(',', ':'))  # No whitespace
         
         print(f"Replay saved to {filepath}")
-        return filepath
\ No newline at end of file
+        return filepath
+
+    def to_bytes(self) -> bytes:
+        """Serialize the recorded replay into a compact, immutable blob"""
+        replay_data = {
+            "metadata": self.metadata,
+            "frames": self.frames,
+            "winner": self.metadata.get("w", 0),
+            "total_frames": self._frame_count
+        }
+        return json.dumps(replay_data, separators=(',', ':')).encode('utf-8')
+
+    def summary(self, winner: int = 0) -> Dict[str, Any]:
+        """
+        Small listing record for the replay, kept next to its blob
+
+        Lets callers show or score a replay without decoding every frame
+        with from_bytes.
+        """
+        return {
+            "winner": winner,
+            "duration_seconds": self.metadata.get("d", 0),
+            "total_frames": self._frame_count,
+            "timestamp": self.metadata.get("ts", "")
+        }
+
+    @staticmethod
+    def from_bytes(blob: bytes) -> Dict[str, Any]:
+        """Deserialize a blob produced by to_bytes back into replay data"""
+        return json.loads(blob)
\ No newline at end of file
@@ -1,6 +1,6 @@
 from ..base_reward import RewardEvent
 from ..reward_registry import RewardRegistry
-from typing import Dict, Any
+from ...game_loop.game_state import GameState
 from ...globals.constants import ARENA_WIDTH
 
 
@@ -8,18 +8,14 @@ from ...globals.constants import ARENA_WIDTH
 class DistanceX(RewardEvent):
     """Reward for landing an attack"""
     
-    def __init__(self):
-        super().__init__(
-            name="distance_x",
-            description="horizontal distance between the two players",
-            category='Distance',
-            higher_is_better=False,
-            is_continuous=True
-        )
+    name = "distance_x"
+    description = "horizontal distance between the two players"
+    category = 'Distance'
+    higher_is_better = False
+    is_continuous = True
     
-    def measure(self, game_state: Dict[str, Any]) -> float:
+    def measure(self, game_state: GameState, player_id: int) -> float:
         # Returns the normalised distance between the two players
-        p1_x = game_state['player1']['x']
-        p2_x = game_state['player2']['x']
+        x = game_state.snapshot()['x']
 
-        return abs(p1_x - p2_x)/ARENA_WIDTH
\ No newline at end of file
+        return abs(x[0] - x[1])/ARENA_WIDTH
\ No newline at end of file
@@ -1,7 +1,6 @@
 from typing import Dict, List, Type, Optional
 import importlib
-import os
-import glob
+import pkgutil
 from .base_reward import RewardEvent
 
 
@@ -9,6 +8,7 @@ class RewardRegistry:
     """Registry for all available reward events"""
     
     _events: Dict[str, Type[RewardEvent]] = {}
+    _discovered: bool = False
     
     @classmethod
     def register(cls, event_class: Type[RewardEvent]):
@@ -32,22 +32,19 @@ class RewardRegistry:
         return cls._events.copy()
     
     @classmethod
-    def auto_discover(cls, directory: str = 'rewards/events'):
-        """Auto-discover reward events from Python files in directory"""
-        # Get absolute path to the directory
-        module_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), directory)
+    def auto_discover(cls, package: str = 'events'):
+        """Auto-discover reward events from the modules of a rewards subpackage"""
+        # Discovery only ever needs to run once per process
+        if cls._discovered:
+            return
         
-        # Find all Python files in the directory
-        for file_path in glob.glob(os.path.join(module_dir, '*.py')):
-            if os.path.basename(file_path) in ['__init__.py', 'base_reward.py']:
-                continue
-                
-            # Convert file path to module path
-            rel_path = os.path.relpath(file_path, os.path.dirname(os.path.dirname(module_dir)))
-            module_path = os.path.splitext(rel_path)[0].replace(os.path.sep, '.')
-            
-            # Import the module
+        events_package = importlib.import_module(f"{__package__}.{package}")
+        
+        # Import each module so its @RewardRegistry.register decorators run
+        for module_info in pkgutil.iter_modules(events_package.__path__, prefix=f"{events_package.__name__}."):
             try:
-                importlib.import_module(module_path)
+                importlib.import_module(module_info.name)
             except ImportError as e:
-                print(f"Failed to import {module_path}: {e}")
+                print(f"Failed to import {module_info.name}: {e}")
+        
+        cls._discovered = True
@@ -5,6 +5,7 @@ from ..protocols.message_types import GamePhase, ServerMessageType, ClientMessag
 from ...players import Player
 from ...shop import ShopManager
 from ...game_loop import GameManager, GameEngine
+from ...replays import ReplayRecorder
 from ...globals.constants import ITEM_DIRECTORY, STARTING_GOLD
 import logging
 import datetime
@@ -356,6 +357,7 @@ class GameCoordinator:
                 s.batch_wins = 0
                 s.batch_losses = 0
                 s.batch_recorded_replays = []
+                s.batch_replay_summaries = []
                 s.current_replay = None
                 s.current_replay_index = 0
                 s.replay_viewed = False
@@ -592,6 +594,7 @@ class GameCoordinator:
             session.batch_wins = opponent_session.batch_losses  # Swap wins/losses
             session.batch_losses = opponent_session.batch_wins
             session.batch_recorded_replays = opponent_session.batch_recorded_replays
+            session.batch_replay_summaries = opponent_session.batch_replay_summaries
             session.current_replay = opponent_session.current_replay
             session.current_replay_index = opponent_session.current_replay_index
             session.replay_viewed = False
@@ -620,6 +623,7 @@ class GameCoordinator:
                 session.batch_wins = opponent_session.batch_losses  # Swap wins/losses
                 session.batch_losses = opponent_session.batch_wins
                 session.batch_recorded_replays = opponent_session.batch_recorded_replays
+                session.batch_replay_summaries = opponent_session.batch_replay_summaries
                 session.current_replay = opponent_session.current_replay
                 session.current_replay_index = opponent_session.current_replay_index
                 session.replay_viewed = False
@@ -647,12 +651,14 @@ class GameCoordinator:
         session.batch_wins = 0
         session.batch_losses = 0
         session.batch_recorded_replays = []
+        session.batch_replay_summaries = []
         
         opponent_session.current_batch_id = batch_id
         opponent_session.batch_fights_completed = 0
         opponent_session.batch_wins = 0
         opponent_session.batch_losses = 0
         opponent_session.batch_recorded_replays = []
+        opponent_session.batch_replay_summaries = []
         
         # ==================== STEP 7: NOTIFY CLIENTS ====================
         # Send notification that fights are about to begin
@@ -719,26 +725,29 @@ class GameCoordinator:
             
             # ==================== STEP 9: PROCESS RESULTS ====================
             # Update session with batch results
-            if local_is_player_1:
-                session.batch_wins = batch_results["client_1_wins"]
-                session.batch_losses = batch_results["completed_fights"] - batch_results["client_1_wins"]
-                opponent_session.batch_wins = batch_results["client_2_wins"]
-                opponent_session.batch_losses = batch_results["completed_fights"] - batch_results["client_2_wins"]
-            else:
-                session.batch_wins = batch_results["client_2_wins"]
-                session.batch_losses = batch_results["completed_fights"] - batch_results["client_2_wins"]
-                opponent_session.batch_wins = batch_results["client_1_wins"]
-                opponent_session.batch_losses = batch_results["completed_fights"] - batch_results["client_1_wins"]
+            completed_fights = batch_results["completed_fights"]
+            client_1_wins = batch_results["client_1_wins"]
+            client_2_wins = batch_results["client_2_wins"]
+            local_wins, opponent_wins = (
+                (client_1_wins, client_2_wins) if local_is_player_1 else (client_2_wins, client_1_wins)
+            )
+            
+            session.batch_wins = local_wins
+            session.batch_losses = completed_fights - local_wins
+            opponent_session.batch_wins = opponent_wins
+            opponent_session.batch_losses = completed_fights - opponent_wins
             
             # Update fight counters
-            session.batch_fights_completed = batch_results["completed_fights"]
-            session.fights_completed += batch_results["completed_fights"]
-            opponent_session.batch_fights_completed = batch_results["completed_fights"]
-            opponent_session.fights_completed += batch_results["completed_fights"]
+            session.batch_fights_completed = completed_fights
+            session.fights_completed += completed_fights
+            opponent_session.batch_fights_completed = completed_fights
+            opponent_session.fights_completed += completed_fights
             
             # Store recorded replays
             session.batch_recorded_replays = batch_results["recorded_replays"]
             opponent_session.batch_recorded_replays = batch_results["recorded_replays"]
+            session.batch_replay_summaries = batch_results["recorded_replay_summaries"]
+            opponent_session.batch_replay_summaries = batch_results["recorded_replay_summaries"]
             
             # Store latest replay
             if batch_results["recorded_replays"]:
@@ -831,7 +840,7 @@ class GameCoordinator:
         await self.send_to_client(session.client_id, {
             "type": ServerMessageType.REPLAY_DATA.value,
             "batch_summary": batch_summary,
-            "replay_data": session.batch_recorded_replays[0],
+            "replay_data": ReplayRecorder.from_bytes(session.batch_recorded_replays[0]),
             "replay_index": 0,
             "total_replays": len(session.batch_recorded_replays),
             "is_final_replay": len(session.batch_recorded_replays) == 1,
@@ -846,7 +855,7 @@ class GameCoordinator:
         """
         # Apply fight rewards first
         if session.current_replay:
-            winner = session.current_replay.get("metadata", {}).get("winner", 0)
+            winner = session.batch_replay_summaries[session.current_replay_index]["winner"]
             gold_earned = 100 if winner == 1 else 50  # Example rewards
             self.shop_manager.add_gold_to_client(session.client_id, gold_earned)
         
@@ -1013,7 +1022,7 @@ class GameCoordinator:
         # Send replay to client
         await self.send_to_client(session.client_id, {
             "type": message_type,
-            "replay_data": replay_data,
+            "replay_data": ReplayRecorder.from_bytes(replay_data),
             "replay_index": index,
             "total_replays": len(session.batch_recorded_replays),
             "is_final_replay": index == len(session.batch_recorded_replays) - 1,
@@ -1031,17 +1040,12 @@ class GameCoordinator:
         
         # Create list of replay summaries
         replay_summaries = []
-        for idx, replay in enumerate(session.batch_recorded_replays):
-            metadata = replay.get("metadata", {})
-            
-            # Extract relevant metadata for list display
+        for idx, replay_summary in enumerate(session.batch_replay_summaries):
+            # Built from the summaries stored with the blobs, so nothing is decoded
             summary = {
                 "index": idx,
                 "fight_number": (idx + 1) * 10,  # Fights 10, 20, 30, etc.
-                "winner": metadata.get("w", 0),
-                "duration_seconds": metadata.get("d", 0),
-                "total_frames": metadata.get("tf", 0),
-                "timestamp": metadata.get("ts", "")
+                **replay_summary
             }
             replay_summaries.append(summary)
         
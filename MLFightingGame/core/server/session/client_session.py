@@ -21,7 +21,7 @@ class ClientSession:
     
     # Fight state
     current_opponent: Optional['Player'] = None
-    current_replay: Optional[dict] = None
+    current_replay: Optional[bytes] = None
     replay_viewed: bool = False
 
     # Batch state
@@ -30,6 +30,7 @@ class ClientSession:
     batch_wins: int = 0
     batch_losses: int = 0
     batch_recorded_replays: list = None
+    batch_replay_summaries: list = None  # ReplayRecorder.summary per recorded replay
     current_replay_index: int = 0
     
     # Progress tracking
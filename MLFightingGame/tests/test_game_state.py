@@ -0,0 +1,177 @@
+import random
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from ..core.data_classes import PlayerState
+from ..core.game_loop import GameManager, GameState
+from ..core.globals import State
+from ..core.globals.constants import MAX_X_VELOCITY, MAX_Y_VELOCITY
+from ..core.players import Player
+
+
+def reference_state_vector(game_state: GameState, player_id: int) -> np.ndarray:
+    """The state vector as originally computed, straight from the PlayerState attributes"""
+    player = game_state.get_player(player_id)
+    opponent = game_state.get_opponent(player_id)
+
+    features = []
+    for state in (player, opponent):
+        features += [
+            state.x / game_state.arena_width,
+            state.y / game_state.arena_height,
+            state.health / state.max_health,
+            state.velocity_x / MAX_X_VELOCITY,
+            state.velocity_y / MAX_Y_VELOCITY,
+            float(state.current_state in [State.JUMP_ACTIVE, State.JUMP_RISING, State.JUMP_FALLING]),
+            float(state.current_state == State.BLOCK_ACTIVE),
+            float(state.current_state == State.ATTACK_ACTIVE),
+            state.attack_cooldown_remaining / state.attack_cooldown,
+        ]
+    features += [
+        abs(opponent.x - player.x) / game_state.arena_width,
+        abs(opponent.y - player.y) / game_state.arena_height
+    ]
+    return np.array(features, dtype=np.float32)
+
+
+def random_player_state(rng: np.random.Generator, player_id: int, current_state: State) -> PlayerState:
+    """A PlayerState with every field the state vector reads set at random"""
+    max_health = float(rng.uniform(50.0, 200.0))
+    attack_cooldown = int(rng.integers(5, 40))
+    return PlayerState(
+        player_id=player_id,
+        x=float(rng.uniform(0.0, 800.0)),
+        y=float(rng.uniform(-400.0, 0.0)),
+        health=float(rng.uniform(0.0, max_health)),
+        max_health=max_health,
+        velocity_x=float(rng.uniform(-MAX_X_VELOCITY, MAX_X_VELOCITY)),
+        velocity_y=float(rng.uniform(-MAX_Y_VELOCITY, MAX_Y_VELOCITY)),
+        attack_cooldown=attack_cooldown,
+        attack_cooldown_remaining=int(rng.integers(0, attack_cooldown + 1)),
+        current_state=current_state
+    )
+
+
+class TestStateVector(unittest.TestCase):
+    """Test the synced state block against the original per-attribute computation"""
+
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+
+    def make_game_state(self, state_1: State, state_2: State) -> GameState:
+        return GameState(
+            arena_width=800,
+            arena_height=400,
+            player1_state=random_player_state(self.rng, 1, state_1),
+            player2_state=random_player_state(self.rng, 2, state_2)
+        )
+
+    def test_matches_reference_for_every_state(self):
+        """Both players' vectors match for every combination of player states"""
+        states = list(State)
+        for state_1 in states:
+            for state_2 in states:
+                game_state = self.make_game_state(state_1, state_2)
+                game_state.sync_players()
+                for player_id in (1, 2):
+                    np.testing.assert_allclose(
+                        game_state.get_state_vector(player_id),
+                        reference_state_vector(game_state, player_id),
+                        rtol=1e-6, atol=1e-7
+                    )
+
+    def test_snapshot_matches_attributes(self):
+        """snapshot() holds each player's raw hot fields"""
+        game_state = self.make_game_state(State.JUMP_RISING, State.ATTACK_ACTIVE)
+        game_state.sync_players()
+        snapshot = game_state.snapshot()
+
+        for row, player in enumerate(game_state.players):
+            for name in ("x", "y", "health", "velocity_x", "velocity_y"):
+                self.assertEqual(snapshot[row][name], getattr(player, name))
+            self.assertEqual(snapshot[row]["attack_cooldown"], player.attack_cooldown_remaining)
+        np.testing.assert_array_equal(snapshot["is_jumping"], [1.0, 0.0])
+        np.testing.assert_array_equal(snapshot["is_blocking"], [0.0, 0.0])
+        np.testing.assert_array_equal(snapshot["is_attacking"], [0.0, 1.0])
+        self.assertEqual(
+            game_state.get_distance_between_players(),
+            (abs(game_state.players[1].x - game_state.players[0].x),
+             abs(game_state.players[1].y - game_state.players[0].y))
+        )
+
+    def test_values_are_as_of_last_sync(self):
+        """Attribute changes only show up in the vector after the next sync"""
+        game_state = self.make_game_state(State.IDLE, State.IDLE)
+        game_state.sync_players()
+        before = game_state.get_state_vector(1).copy()
+
+        game_state.get_player(1).x += 100.0
+        np.testing.assert_array_equal(game_state.get_state_vector(1), before)
+
+        game_state.sync_players()
+        np.testing.assert_allclose(game_state.get_state_vector(1), reference_state_vector(game_state, 1), rtol=1e-6)
+
+    def test_vector_buffer_is_reused(self):
+        """Each player's vector is one buffer, overwritten on the next call"""
+        game_state = self.make_game_state(State.IDLE, State.IDLE)
+        game_state.sync_players()
+        first = game_state.get_state_vector(1)
+        self.assertIs(game_state.get_state_vector(1), first)
+        self.assertIsNot(game_state.get_state_vector(2), first)
+
+    def test_clone_is_independent(self):
+        """A clone keeps its own block and vector buffers"""
+        game_state = self.make_game_state(State.IDLE, State.BLOCK_ACTIVE)
+        game_state.sync_players()
+        clone = game_state.clone()
+        expected = reference_state_vector(game_state, 2)
+
+        game_state.get_player(2).x += 50.0
+        game_state.sync_players()
+        np.testing.assert_allclose(clone.get_state_vector(2), expected, rtol=1e-6, atol=1e-7)
+        self.assertIsNot(clone.get_state_vector(2), game_state.get_state_vector(2))
+
+
+class TestEngineStateVectors(unittest.TestCase):
+    """Test that agents see the same vectors during a fight as the original computation gives"""
+
+    FRAMES = 300
+
+    def test_decisions_and_updates_match_reference(self):
+        manager = GameManager()
+        player_1 = Player(1, "aggressive")
+        player_2 = Player(2, "defensive")
+        fight_id = manager.create_fight("client_1", "client_2", player_1, player_2)
+        engine = manager.active_fights[fight_id].game_engine
+        game_state = manager.active_fights[fight_id].game_state
+        rng = random.Random(0)
+        checked = {"actions": 0, "updates": 0}
+
+        def get_action(player, state_vector, available_actions=None):
+            np.testing.assert_allclose(
+                state_vector, reference_state_vector(engine.state, player.player_id), rtol=1e-6, atol=1e-7
+            )
+            checked["actions"] += 1
+            return rng.randrange(player.num_actions)
+
+        def update(player, state, action, reward, next_state, done):
+            np.testing.assert_allclose(
+                next_state, reference_state_vector(engine.state, player.player_id), rtol=1e-6, atol=1e-7
+            )
+            checked["updates"] += 1
+
+        with mock.patch.object(Player, "get_action", autospec=True, side_effect=get_action), \
+             mock.patch.object(Player, "update", autospec=True, side_effect=update):
+            for _ in range(self.FRAMES):
+                engine.step(game_state)
+                if engine.fight_over:
+                    break
+
+        self.assertGreater(checked["actions"], 0)
+        self.assertGreater(checked["updates"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,161 @@
+import unittest
+
+import numpy as np
+
+from ..core.data_classes import Fighter
+from ..core.players import _hitbox_kernels, _stat_kernels
+from ..core.players._hitbox_kernels import compute_hitbox, compute_attack_hitbox, boxes_overlap
+from ..core.players._stat_kernels import combine_stats
+
+
+def reference_hitbox(x, y, width, height):
+    """Body hitbox as originally computed, as an (x1, y1, x2, y2) tuple"""
+    return (x - width / 2, y - height / 2, x + width / 2, y + height / 2)
+
+
+def reference_attack_hitbox(x, y, width, facing_right, x_range, y_range):
+    """Attack hitbox as originally computed, as an (x1, y1, x2, y2) tuple"""
+    direction = 1 if facing_right else -1
+    start_x = x + width / 2 * direction
+    end_x = start_x + x_range * direction
+    return (min(start_x, end_x), y - y_range / 2, max(start_x, end_x), y + y_range / 2)
+
+
+def reference_overlap(box1, box2):
+    """Overlap test as originally computed"""
+    x1_1, y1_1, x2_1, y2_1 = box1
+    x1_2, y1_2, x2_2, y2_2 = box2
+    return not (x2_1 < x1_2 or x2_2 < x1_1 or y2_1 < y1_2 or y2_2 < y1_1)
+
+
+def random_boxes(rng: np.random.Generator, count: int):
+    """Pairs of (x, y, width, height) draws, on a coarse grid so edges often touch"""
+    return rng.integers(0, 40, (count, 4)).astype(np.float64) * np.array([20.0, -10.0, 5.0, 5.0]) + [0, 0, 10, 10]
+
+
+class TestHitboxKernels(unittest.TestCase):
+    """Test the hitbox kernels against the original tuple-based computation"""
+
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+        self.out = np.empty(4)
+
+    def test_hitbox_matches_reference(self):
+        for x, y, width, height in random_boxes(self.rng, 200):
+            box = compute_hitbox(self.out, x, y, width, height)
+            self.assertIs(box, self.out)
+            self.assertEqual(tuple(box.tolist()), reference_hitbox(x, y, width, height))
+
+    def test_attack_hitbox_matches_reference(self):
+        for x, y, width, y_range in random_boxes(self.rng, 200):
+            x_range = float(self.rng.uniform(-20.0, 120.0))
+            for facing_right in (True, False):
+                box = compute_attack_hitbox(self.out, x, y, width, facing_right, x_range, y_range)
+                self.assertEqual(
+                    tuple(box.tolist()),
+                    reference_attack_hitbox(x, y, width, facing_right, x_range, y_range)
+                )
+
+    def test_overlap_matches_reference(self):
+        """Includes boxes whose edges only touch, which count as overlapping"""
+        boxes = [reference_hitbox(*draw) for draw in random_boxes(self.rng, 60)]
+        touching = 0
+        for box1 in boxes:
+            for box2 in boxes:
+                expected = reference_overlap(box1, box2)
+                self.assertEqual(boxes_overlap(np.array(box1), np.array(box2)), expected)
+                touching += expected and (box1[2] == box2[0] or box1[3] == box2[1])
+        self.assertGreater(touching, 0)
+
+
+@unittest.skipUnless(_hitbox_kernels.NUMBA_AVAILABLE, "numba is not installed")
+class TestCompiledHitboxKernels(unittest.TestCase):
+    """Test that the compiled hitbox kernels agree with their Python source"""
+
+    def setUp(self):
+        self.rng = np.random.default_rng(1)
+
+    def test_hitbox_parity(self):
+        for x, y, width, height in random_boxes(self.rng, 200):
+            np.testing.assert_array_equal(
+                compute_hitbox(np.empty(4), x, y, width, height),
+                compute_hitbox.py_func(np.empty(4), x, y, width, height)
+            )
+
+    def test_attack_hitbox_parity(self):
+        for x, y, width, y_range in random_boxes(self.rng, 200):
+            x_range = float(self.rng.uniform(-20.0, 120.0))
+            for facing_right in (True, False):
+                np.testing.assert_array_equal(
+                    compute_attack_hitbox(np.empty(4), x, y, width, facing_right, x_range, y_range),
+                    compute_attack_hitbox.py_func(np.empty(4), x, y, width, facing_right, x_range, y_range)
+                )
+
+    def test_overlap_parity(self):
+        boxes = [np.array(reference_hitbox(*draw)) for draw in random_boxes(self.rng, 60)]
+        for box1 in boxes:
+            for box2 in boxes:
+                self.assertEqual(boxes_overlap(box1, box2), boxes_overlap.py_func(box1, box2))
+
+
+@unittest.skipIf(_hitbox_kernels.NUMBA_AVAILABLE, "numba is installed")
+class TestHitboxKernelFallback(unittest.TestCase):
+    """Test that without numba the kernels are the plain Python functions"""
+
+    def test_kernels_are_plain_functions(self):
+        for kernel in (compute_hitbox, compute_attack_hitbox, boxes_overlap):
+            self.assertFalse(hasattr(kernel, "py_func"))
+            self.assertEqual(kernel.__module__, _hitbox_kernels.__name__)
+
+    def test_njit_shim_is_a_no_op(self):
+        """Both decorator forms hand back the function unchanged"""
+        def kernel(value):
+            return value
+
+        self.assertIs(_hitbox_kernels.njit(kernel), kernel)
+        self.assertIs(_hitbox_kernels.njit("f8(f8)", cache=True)(kernel), kernel)
+
+
+def random_stat_inputs(rng: np.random.Generator):
+    """Base stats and read-only weapon/armour modifier vectors, like Player passes"""
+    size = len(Fighter.STAT_FIELDS)
+    base = rng.uniform(0.0, 200.0, size)
+    modifiers = [rng.uniform(0.5, 1.5, size), rng.uniform(-20.0, 20.0, size),
+                 rng.uniform(0.5, 1.5, size), rng.uniform(-20.0, 20.0, size)]
+    for vector in modifiers:
+        vector.flags.writeable = False
+    return base, modifiers
+
+
+class TestCombineStats(unittest.TestCase):
+    """Test the stat kernel against the NumPy expression it replaced"""
+
+    def test_matches_numpy_expression(self):
+        rng = np.random.default_rng(2)
+        for _ in range(50):
+            base, (weapon_mul, weapon_add, armour_mul, armour_add) = random_stat_inputs(rng)
+            out = np.empty_like(base)
+            result = combine_stats(out, base, weapon_mul, weapon_add, armour_mul, armour_add)
+            self.assertIs(result, out)
+            np.testing.assert_array_equal(result, base * (weapon_mul * armour_mul) + (weapon_add + armour_add))
+
+    @unittest.skipUnless(_stat_kernels.NUMBA_AVAILABLE, "numba is not installed")
+    def test_compiled_parity(self):
+        """The compiled kernel agrees bit for bit with its Python source"""
+        rng = np.random.default_rng(3)
+        for _ in range(50):
+            base, modifiers = random_stat_inputs(rng)
+            np.testing.assert_array_equal(
+                combine_stats(np.empty_like(base), base, *modifiers),
+                combine_stats.py_func(np.empty_like(base), base, *modifiers)
+            )
+
+    @unittest.skipIf(_stat_kernels.NUMBA_AVAILABLE, "numba is installed")
+    def test_fallback_is_plain_function(self):
+        """Without numba the kernel is the undecorated Python function"""
+        self.assertFalse(hasattr(combine_stats, "py_func"))
+        self.assertEqual(combine_stats.__module__, _stat_kernels.__name__)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
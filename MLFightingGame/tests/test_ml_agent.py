@@ -0,0 +1,286 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+import torch
+
+from ..core.players.ml_agent import MLAgent
+from ..core.players.player import Player
+
+
+NUM_FEATURES = 4
+NUM_ACTIONS = 6
+
+
+def make_transitions(count: int, start: int = 0, done_every: int = 0):
+    """Transitions whose states encode their index, so rows can be traced in memory"""
+    index = np.arange(start, start + count, dtype=np.float32)
+    states = np.repeat(index[:, None], NUM_FEATURES, axis=1)
+    actions = np.arange(start, start + count) % NUM_ACTIONS
+    rewards = index.copy()
+    next_states = states + 0.5
+    dones = np.zeros(count, dtype=np.float32)
+    if done_every:
+        dones[done_every - 1::done_every] = 1.0
+    return states, actions, rewards, next_states, dones
+
+
+class TestUpdateBatch(unittest.TestCase):
+    """Test bulk experience ingestion for a learner"""
+
+    def setUp(self):
+        self.agent = MLAgent(
+            num_features=NUM_FEATURES,
+            num_actions=NUM_ACTIONS,
+            device='cpu',
+            seed=0,
+            batch_size=32,
+            update_frequency=4
+        )
+
+    def test_ring_buffer_wrap(self):
+        """A block that runs past the end of memory wraps to the start"""
+        memory_size = self.agent.memory_size
+        with mock.patch.object(MLAgent, '_train_step'):
+            self.agent.update_batch(*make_transitions(memory_size - 2))
+            self.agent.update_batch(*make_transitions(5, start=memory_size - 2))
+
+        self.assertEqual(self.agent._size, memory_size)
+        self.assertEqual(self.agent._write_idx, 3)
+        # Last two slots hold the first part of the block, the first three the rest
+        np.testing.assert_array_equal(self.agent._rewards[-2:], [memory_size - 2, memory_size - 1])
+        np.testing.assert_array_equal(self.agent._rewards[:3], [memory_size, memory_size + 1, memory_size + 2])
+        np.testing.assert_array_equal(self.agent._next_states[0], np.full(NUM_FEATURES, memory_size + 0.5))
+        # Untouched rows from the first block are kept
+        self.assertEqual(self.agent._rewards[3], 3)
+
+    def test_block_larger_than_memory(self):
+        """Only the newest memory_size transitions of an oversized block are kept"""
+        memory_size = self.agent.memory_size
+        with mock.patch.object(MLAgent, '_train_step'):
+            self.agent.update_batch(*make_transitions(memory_size + 5))
+
+        self.assertEqual(self.agent._size, memory_size)
+        self.assertEqual(self.agent._write_idx, 0)
+        self.assertEqual(self.agent.steps, memory_size + 5)
+        np.testing.assert_array_equal(self.agent._rewards, np.arange(5, memory_size + 5))
+        np.testing.assert_array_equal(self.agent._actions, np.arange(5, memory_size + 5) % NUM_ACTIONS)
+
+    def test_epsilon_decays_per_finished_episode(self):
+        """Epsilon decays once per done flag and never drops below epsilon_min"""
+        params = self.agent.learning_parameters
+        with mock.patch.object(MLAgent, '_train_step'):
+            self.agent.update_batch(*make_transitions(10, done_every=5))
+        self.assertEqual(self.agent.episodes, 2)
+        self.assertAlmostEqual(self.agent.epsilon, params.epsilon_decay ** 2)
+
+        params.epsilon = params.epsilon_min * 1.001
+        with mock.patch.object(MLAgent, '_train_step'):
+            self.agent.update_batch(*make_transitions(10, done_every=1))
+        self.assertEqual(self.agent.epsilon, params.epsilon_min)
+
+    def test_train_steps_per_boundary(self):
+        """One train step per update_frequency boundary once memory holds a batch"""
+        with mock.patch.object(MLAgent, '_train_step') as train_step:
+            # 20 rows: below batch_size, so no training despite 5 boundaries
+            self.agent.update_batch(*make_transitions(20))
+            self.assertEqual(train_step.call_count, 0)
+
+            # Memory now holds 40 >= 32 rows; steps 20 -> 40 crosses 5 boundaries
+            self.agent.update_batch(*make_transitions(20, start=20))
+            self.assertEqual(train_step.call_count, 5)
+
+    def test_training_gated_on_size_after_block(self):
+        """The size check uses the whole block, so early boundaries still train"""
+        with mock.patch.object(MLAgent, '_train_step') as train_step:
+            self.agent.update_batch(*make_transitions(40))
+        # Per-transition updates would only train at steps 32, 36 and 40
+        self.assertEqual(train_step.call_count, 10)
+
+    def test_target_sync_on_boundary(self):
+        """The target network is refreshed when a target_update_frequency boundary is crossed"""
+        with torch.no_grad():
+            for param in self.agent.q_network.parameters():
+                param.add_(1.0)
+        with mock.patch.object(MLAgent, '_train_step'):
+            self.agent.update_batch(*make_transitions(self.agent.target_update_frequency - 1))
+        online = self.agent.q_network.state_dict()
+        target = self.agent.target_network.state_dict()
+        self.assertFalse(torch.equal(online['network.0.weight'], target['network.0.weight']))
+
+        with mock.patch.object(MLAgent, '_train_step'):
+            self.agent.update_batch(*make_transitions(1))
+        target = self.agent.target_network.state_dict()
+        self.assertTrue(torch.equal(online['network.0.weight'], target['network.0.weight']))
+
+    def test_empty_block(self):
+        """An empty block changes nothing"""
+        self.agent.update_batch(*make_transitions(0))
+        self.assertEqual(self.agent.steps, 0)
+        self.assertEqual(self.agent._size, 0)
+
+
+class TestPolicyStateDict(unittest.TestCase):
+    """Test shipping the online network's weights to actors"""
+
+    def setUp(self):
+        self.learner = MLAgent(num_features=NUM_FEATURES, num_actions=NUM_ACTIONS, device='cpu', seed=0)
+        self.actor = MLAgent(num_features=NUM_FEATURES, num_actions=NUM_ACTIONS, device='cpu', seed=1)
+
+    def test_copy_is_detached(self):
+        """The exported weights are CPU copies that do not alias the learner"""
+        state_dict = self.learner.policy_state_dict()
+        for name, tensor in self.learner.q_network.state_dict().items():
+            self.assertEqual(state_dict[name].device.type, 'cpu')
+            self.assertTrue(torch.equal(state_dict[name], tensor))
+
+        state_dict['network.0.weight'].add_(1.0)
+        self.assertFalse(torch.equal(
+            state_dict['network.0.weight'],
+            self.learner.q_network.state_dict()['network.0.weight']
+        ))
+
+    def test_actor_matches_learner(self):
+        """An actor loaded from the learner's weights gives the same Q-values"""
+        # The online network trains with dropout; compare deterministic forwards
+        self.learner.q_network.eval()
+        self.actor.q_network.eval()
+        state = np.linspace(0.0, 1.0, NUM_FEATURES, dtype=np.float32)
+        self.assertFalse(np.allclose(self.actor.get_q_values(state), self.learner.get_q_values(state)))
+
+        self.actor.load_policy_state_dict(self.learner.policy_state_dict())
+        np.testing.assert_allclose(self.actor.get_q_values(state), self.learner.get_q_values(state))
+
+class TestCompiledInference(unittest.TestCase):
+    """Test single-state inference through the (CUDA-only) compiled network"""
+
+    def setUp(self):
+        self.agent = MLAgent(num_features=NUM_FEATURES, num_actions=NUM_ACTIONS, device='cpu', seed=0)
+        self.state = np.linspace(0.0, 1.0, NUM_FEATURES, dtype=np.float32)
+
+    def use_compiled(self, compiled):
+        """Stand in for torch.compile's module, which is only built on CUDA"""
+        self.agent._q_infer = compiled
+        self.agent._q_infer_ready = False
+
+    def test_masking_leaves_output_untouched(self):
+        """get_action masks a copy, never the (graph-owned) network output"""
+        output = torch.arange(NUM_ACTIONS, dtype=torch.float32).unsqueeze(0)
+        self.use_compiled(mock.Mock(return_value=output))
+
+        action = self.agent.get_action(self.state, available_actions=[0, 2], epsilon=0.0)
+        self.assertEqual(action, 2)
+        torch.testing.assert_close(output, torch.arange(NUM_ACTIONS, dtype=torch.float32).unsqueeze(0))
+
+    def test_backend_failure_falls_back_once(self):
+        """A failed compile switches to the eager network for good"""
+        failure = torch._dynamo.exc.BackendCompilerFailed(None, RuntimeError("no compiler"), None)
+        compiled = mock.Mock(side_effect=failure)
+        self.use_compiled(compiled)
+
+        self.agent.get_q_values(self.state)
+        self.agent.get_q_values(self.state)
+        self.assertEqual(compiled.call_count, 1)
+        self.assertIs(self.agent._q_infer, self.agent.q_network)
+
+    def test_runtime_errors_propagate(self):
+        """Errors other than a failed compile are not swallowed"""
+        self.use_compiled(mock.Mock(side_effect=RuntimeError("device-side assert")))
+        with self.assertRaises(RuntimeError):
+            self.agent.get_q_values(self.state)
+
+        # After a successful first call, later errors are not caught either
+        self.use_compiled(mock.Mock(return_value=torch.zeros(1, NUM_ACTIONS)))
+        self.agent.get_q_values(self.state)
+        self.agent._q_infer.side_effect = torch._dynamo.exc.BackendCompilerFailed(None, RuntimeError(), None)
+        with self.assertRaises(torch._dynamo.exc.BackendCompilerFailed):
+            self.agent.get_q_values(self.state)
+
+
+def make_action_masks(batch_size: int, seed: int = 0) -> np.ndarray:
+    """Random valid-action masks with at least one allowed action per row"""
+    rng = np.random.default_rng(seed)
+    masks = rng.random((batch_size, NUM_ACTIONS)) < 0.4
+    masks[np.arange(batch_size), rng.integers(0, NUM_ACTIONS, batch_size)] = True
+    # One row with a single allowed action, the last one
+    masks[0] = False
+    masks[0, -1] = True
+    return masks
+
+
+class TestGetActionsBatch(unittest.TestCase):
+    """Test batched epsilon-greedy action selection"""
+
+    BATCH = 64
+
+    def setUp(self):
+        self.agent = MLAgent(num_features=NUM_FEATURES, num_actions=NUM_ACTIONS, device='cpu', seed=0)
+        self.states = np.random.default_rng(1).random((self.BATCH, NUM_FEATURES), dtype=np.float32)
+        self.masks = make_action_masks(self.BATCH)
+
+    def assert_valid_actions(self, actions: np.ndarray, masks: np.ndarray):
+        self.assertEqual(actions.shape, (self.BATCH,))
+        self.assertTrue(np.issubdtype(actions.dtype, np.integer))
+        self.assertTrue(masks[np.arange(self.BATCH), actions].all())
+
+    def test_greedy_respects_masks(self):
+        """With epsilon 0 every row picks its best allowed action"""
+        actions = self.agent.get_actions_batch(self.states, self.masks, epsilon=0.0)
+        self.assert_valid_actions(actions, self.masks)
+        self.assertEqual(actions[0], NUM_ACTIONS - 1)
+
+    def test_greedy_without_masks_is_argmax(self):
+        """Without masks the greedy choice is the plain Q-value argmax"""
+        self.agent.q_network.eval()
+        actions = self.agent.get_actions_batch(self.states, epsilon=0.0)
+        with torch.no_grad():
+            q_values = self.agent.q_network(torch.from_numpy(self.states), self.agent._input_mask)
+        np.testing.assert_array_equal(actions, q_values.argmax(dim=1).numpy())
+
+    def test_exploration_respects_masks(self):
+        """With epsilon 1 every row picks a random allowed action"""
+        for _ in range(20):
+            actions = self.agent.get_actions_batch(self.states, self.masks, epsilon=1.0)
+            self.assert_valid_actions(actions, self.masks)
+
+    def test_exploration_without_masks(self):
+        """Unmasked exploration covers the whole action range"""
+        actions = self.agent.get_actions_batch(self.states, epsilon=1.0)
+        self.assert_valid_actions(actions, np.ones((self.BATCH, NUM_ACTIONS), dtype=bool))
+        self.assertGreater(len(np.unique(actions)), 1)
+
+
+class TestPlayerGetActionsBatch(unittest.TestCase):
+    """Test the Player override, which also advances the epsilon schedule"""
+
+    BATCH = 16
+
+    def setUp(self):
+        self.player = Player(player_id=1, fighter_name="aggressive")
+        self.states = np.random.default_rng(2).random((self.BATCH, self.player.num_features), dtype=np.float32)
+        self.masks = np.zeros((self.BATCH, self.player.num_actions), dtype=bool)
+        self.masks[:, [1, 4]] = True
+
+    def test_actions_respect_masks(self):
+        """Both greedy and exploring rows stay within the mask"""
+        for epsilon in (0.0, 1.0):
+            actions = self.player.get_actions_batch(self.states, self.masks, epsilon=epsilon)
+            self.assertEqual(actions.shape, (self.BATCH,))
+            self.assertTrue(np.issubdtype(actions.dtype, np.integer))
+            self.assertTrue(np.isin(actions, [1, 4]).all())
+
+    def test_epsilon_decays_once_per_row(self):
+        """The batch decays epsilon as if get_action had run once per row"""
+        params = self.player.learning_parameters
+        start = params.epsilon
+        self.player.get_actions_batch(self.states, self.masks)
+        self.assertAlmostEqual(params.epsilon, max(params.epsilon_min, start * params.epsilon_decay ** self.BATCH))
+        self.assertEqual(self.player.actions_taken, self.BATCH)
+
+        params.epsilon = params.epsilon_min
+        self.player.get_actions_batch(self.states, self.masks)
+        self.assertEqual(params.epsilon, params.epsilon_min)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,83 @@
+import unittest
+
+from ..core.data_classes import LearningParameters
+from ..core.players.player import Player
+
+
+def weapon(name: str, attack_damage_modifier: int) -> dict:
+    """Shop dict for a weapon purchase"""
+    return {"category": "weapons", "name": name, "attack_damage_modifier": attack_damage_modifier}
+
+
+def learning_modifier(subcategory: str, delta: float) -> dict:
+    """Shop dict for a learning modifier purchase"""
+    return {"category": "learning_modifiers", "subcategory": subcategory, "delta": delta}
+
+
+class TestLearningModifiers(unittest.TestCase):
+    """Test that bought learning modifiers give the same parameters live and after a rebuild"""
+
+    def setUp(self):
+        self.player = Player(
+            player_id=1,
+            fighter_name="aggressive",
+            learning_parameters=LearningParameters(epsilon=0.9)
+        )
+
+    def assert_rebuild_matches(self):
+        live = self.player.learning_parameters.to_dict()
+        self.player._apply_learning_modifiers()
+        self.assertEqual(self.player.learning_parameters.to_dict(), live)
+
+    def test_clamped_purchases(self):
+        """Each delta is clamped as it is applied, on both paths"""
+        self.player.add_item("eps_up", learning_modifier("epsilon", 0.2))
+        self.player.add_item("eps_down", learning_modifier("epsilon", -0.2))
+        self.assertAlmostEqual(self.player.learning_parameters.epsilon, 0.8)
+        self.assert_rebuild_matches()
+
+    def test_mixed_categories(self):
+        """Interleaved purchases across categories rebuild to the live values"""
+        self.player.add_item("lr_up", learning_modifier("learning_rate", 0.02))
+        self.player.add_item("eps_down", learning_modifier("epsilon", -0.5))
+        self.player.add_item("lr_down", learning_modifier("learning_rate", -0.005))
+        self.player.add_item("decay_up", learning_modifier("epsilon_decay", 0.01))
+        self.assertAlmostEqual(self.player.learning_parameters.learning_rate, 0.005)
+        self.assert_rebuild_matches()
+
+
+class TestFighterRebuilds(unittest.TestCase):
+    """Test that purchases never change a Fighter already handed out"""
+
+    def setUp(self):
+        self.player = Player(player_id=1, fighter_name="aggressive")
+
+    def test_held_fighter_keeps_its_stats(self):
+        """A reference taken after a purchase is unaffected by later rebuilds"""
+        base_damage = self.player.base_fighter.attack_damage
+        self.player.add_item("sword", weapon("Sword", 5))
+        held = self.player.fighter
+
+        # Two more rebuilds, enough to recycle any current/scratch pair
+        self.player.add_item("axe", weapon("Axe", 10))
+        self.player.fighter
+        self.player.add_item("mace", weapon("Mace", 15))
+        latest = self.player.fighter
+
+        self.assertEqual(held.attack_damage, base_damage + 5)
+        self.assertEqual(held.weapon, "Sword")
+        self.assertEqual(latest.attack_damage, base_damage + 15)
+        self.assertEqual(latest.weapon, "Mace")
+        self.assertIsNot(held, latest)
+
+    def test_base_fighter_untouched(self):
+        """Rebuilds never write to FighterLoader's shared base fighter"""
+        base_damage = self.player.base_fighter.attack_damage
+        self.player.add_item("sword", weapon("Sword", 5))
+        self.player.fighter
+        self.assertEqual(self.player.base_fighter.attack_damage, base_damage)
+        self.assertIsNot(self.player.fighter, self.player.base_fighter)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
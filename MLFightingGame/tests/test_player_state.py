@@ -0,0 +1,82 @@
+import pickle
+import unittest
+from dataclasses import asdict, fields, replace
+
+import numpy as np
+
+from ..core.data_classes import PlayerState
+from ..core.game_loop import GameState
+from ..core.globals import State
+
+
+class TestCurrentState(unittest.TestCase):
+    """Test current_state as a State view over the stored current_state_value"""
+
+    def setUp(self):
+        self.state = PlayerState(player_id=1, fighter_name="aggressive", x=120.0, current_state=State.BLOCK_ACTIVE)
+        self.state.last_action_state = np.arange(4, dtype=np.float32)
+
+    def assert_same_state(self, copy: PlayerState, original: PlayerState):
+        self.assertEqual(copy.current_state, original.current_state)
+        self.assertEqual(copy.current_state_value, original.current_state_value)
+        self.assertEqual(copy.x, original.x)
+
+    def test_construction(self):
+        """The constructor takes either the State or its stored value"""
+        self.assertIs(self.state.current_state, State.BLOCK_ACTIVE)
+        self.assertEqual(self.state.current_state_value, State.BLOCK_ACTIVE.value)
+        self.assertIs(PlayerState(current_state_value=State.JUMP_ACTIVE.value).current_state, State.JUMP_ACTIVE)
+        self.assertIs(PlayerState().current_state, State.IDLE)
+
+    def test_assignment(self):
+        """Assigning the property, or calling set_current_state, updates the stored value"""
+        self.state.current_state = State.ATTACK_RECOVERY
+        self.assertEqual(self.state.current_state_value, State.ATTACK_RECOVERY.value)
+        self.state.set_current_state(State.STUNNED)
+        self.assertIs(self.state.current_state, State.STUNNED)
+
+    def test_fields(self):
+        """Dataclass introspection sees the stored value, not the property"""
+        names = [f.name for f in fields(PlayerState)]
+        self.assertIn("current_state_value", names)
+        self.assertNotIn("current_state", names)
+        self.assertEqual(asdict(self.state)["current_state_value"], State.BLOCK_ACTIVE.value)
+
+    def test_asdict_round_trip(self):
+        """Rebuilding from asdict's constructor fields restores the state"""
+        init_names = {f.name for f in fields(PlayerState) if f.init}
+        rebuilt = PlayerState(**{name: value for name, value in asdict(self.state).items() if name in init_names})
+        self.assert_same_state(rebuilt, self.state)
+
+    def test_replace(self):
+        """dataclasses.replace keeps the state unless it is overridden"""
+        self.assert_same_state(replace(self.state), self.state)
+        self.assertIs(replace(self.state, current_state=State.IDLE).current_state, State.IDLE)
+        self.assertIs(replace(self.state, current_state_value=State.IDLE.value).current_state, State.IDLE)
+
+    def test_fast_clone(self):
+        """fast_clone copies the stored value and is independent of the original"""
+        clone = self.state.fast_clone()
+        self.assert_same_state(clone, self.state)
+
+        clone.current_state = State.IDLE
+        clone.last_action_state[0] = 99.0
+        self.assertIs(self.state.current_state, State.BLOCK_ACTIVE)
+        self.assertEqual(self.state.last_action_state[0], 0.0)
+
+    def test_game_state_clone(self):
+        """GameState.clone carries each player's state"""
+        game_state = GameState(player1_state=self.state, player2_state=PlayerState(player_id=2))
+        clone = game_state.clone()
+        self.assert_same_state(clone.get_player(1), self.state)
+        self.assertIsNot(clone.get_player(1), self.state)
+
+    def test_pickle(self):
+        """Pickling round-trips the state"""
+        restored = pickle.loads(pickle.dumps(self.state))
+        self.assert_same_state(restored, self.state)
+        np.testing.assert_array_equal(restored.last_action_state, self.state.last_action_state)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,152 @@
+import json
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from ..core.data_classes import PlayerState
+from ..core.game_loop import GameState
+from ..core.globals import State
+from ..core.replays import ReplayRecorder, ReplayArena
+from ..core.replays.replay_arena import REPLAY_FRAME_DTYPE
+
+
+class TestReplaySerialization(unittest.TestCase):
+    """Test the in-memory replay blob and its summary"""
+
+    def setUp(self):
+        """Record a short fight with a few state changes"""
+        self.state = GameState(
+            arena_width=800,
+            arena_height=400,
+            player1_state=PlayerState(player_id=1, fighter_name="balanced", x=200.0),
+            player2_state=PlayerState(player_id=2, fighter_name="aggressive", x=600.0, facing_right=False)
+        )
+        self.replay_dir = Path("replays")
+        self.existing_replays = set(self.replay_dir.glob("*.json"))
+
+        self.recorder = ReplayRecorder()
+        self.recorder.start_recording(self.state)
+        player1 = self.state.get_player(1)
+        for frame in range(1, 6):
+            player1.x += 5.0
+            if frame == 3:
+                player1.set_current_state(State.ATTACK_STARTUP)
+            self.recorder.record_frame(self.state, frame)
+
+    def tearDown(self):
+        """Remove replay files written by save_replay"""
+        for replay_file in set(self.replay_dir.glob("*.json")) - self.existing_replays:
+            replay_file.unlink()
+
+    def test_round_trip(self):
+        """from_bytes gives back exactly what to_bytes was given"""
+        self.recorder.save_replay(winner=2)
+        blob = self.recorder.to_bytes()
+        self.assertIsInstance(blob, bytes)
+
+        replay = ReplayRecorder.from_bytes(blob)
+        # Same as any JSON transport: player ids come back as string keys
+        self.assertEqual(replay["frames"], json.loads(json.dumps(self.recorder.frames)))
+        self.assertEqual(replay["metadata"], self.recorder.metadata)
+        self.assertEqual(replay["winner"], 2)
+        self.assertEqual(replay["total_frames"], 5)
+
+        # Delta compression survives the trip: frame 3 only carries the changes
+        self.assertEqual(replay["frames"][2]["p"]["1"], {"x": 215.0, "s": "ATTACK_STARTUP"})
+        self.assertNotIn("2", replay["frames"][2]["p"])
+
+    def test_round_trip_before_save(self):
+        """A replay serialized before save_replay has no winner yet"""
+        replay = ReplayRecorder.from_bytes(self.recorder.to_bytes())
+        self.assertEqual(replay["winner"], 0)
+        self.assertEqual(len(replay["frames"]), 5)
+
+    def test_summary(self):
+        """The summary carries the fight's winner without touching the frames"""
+        self.recorder.save_replay(winner=1)
+        summary = self.recorder.summary(1)
+        self.assertEqual(summary["winner"], 1)
+        self.assertEqual(summary["total_frames"], 5)
+        self.assertEqual(summary["timestamp"], self.recorder.metadata["ts"])
+        self.assertEqual(summary["duration_seconds"], self.recorder.metadata["d"])
+
+
+class TestReplayArena(unittest.TestCase):
+    """Test frame buffer allocation from a shared replay arena"""
+
+    def test_for_replays_capacity(self):
+        """An arena sized for N replays fits N full-length buffers"""
+        arena = ReplayArena.for_replays(3, 100)
+        buffers = [arena.alloc_frame_buffer(100) for _ in range(3)]
+
+        for buffer in buffers:
+            self.assertEqual(buffer.shape, (100,))
+            self.assertEqual(buffer.dtype, REPLAY_FRAME_DTYPE)
+            self.assertIs(buffer.base, arena._buffer)
+        self.assertLessEqual(arena.bytes_used, len(arena._buffer))
+
+    def test_buffers_are_aligned_and_disjoint(self):
+        """Each buffer starts on an ALIGNMENT boundary after the previous one"""
+        arena = ReplayArena(4096)
+        first = arena.alloc_frame_buffer(3)
+        second = arena.alloc_frame_buffer(3)
+
+        offset = second.ctypes.data - first.ctypes.data
+        self.assertEqual(offset % ReplayArena.ALIGNMENT, 0)
+        self.assertGreaterEqual(offset, first.nbytes)
+
+        first[:] = np.zeros(3, dtype=REPLAY_FRAME_DTYPE)
+        second["f"] = 7
+        self.assertTrue((first["f"] == 0).all())
+
+    def test_fallback_when_exhausted(self):
+        """Requests that do not fit get a standalone array and leave the arena untouched"""
+        arena = ReplayArena(REPLAY_FRAME_DTYPE.itemsize * 10)
+        arena.alloc_frame_buffer(10)
+        used = arena.bytes_used
+
+        overflow = arena.alloc_frame_buffer(5)
+        self.assertEqual(overflow.shape, (5,))
+        self.assertIsNone(overflow.base)
+        self.assertEqual(arena.bytes_used, used)
+
+    def test_empty_arena(self):
+        """An arena for zero replays always falls back"""
+        arena = ReplayArena.for_replays(0, 100)
+        buffer = arena.alloc_frame_buffer(100)
+        self.assertEqual(buffer.shape, (100,))
+        self.assertEqual(arena.bytes_used, 0)
+
+    def test_backing_memory_is_lazy(self):
+        """No memory is allocated until a buffer is carved out, and then only capacity_bytes"""
+        arena = ReplayArena.for_replays(2, 100)
+        self.assertIsNone(arena._buffer)
+
+        arena.alloc_frame_buffer(100)
+        self.assertEqual(len(arena._buffer), arena.capacity_bytes)
+
+    def test_oversized_request_leaves_arena_unallocated(self):
+        """A request that can never fit falls back without allocating the arena"""
+        arena = ReplayArena(64)
+        arena.alloc_frame_buffer(100)
+        self.assertIsNone(arena._buffer)
+
+    def test_recorder_uses_bound_arena(self):
+        """A recorder bound to an arena records into arena memory"""
+        state = GameState(
+            player1_state=PlayerState(player_id=1),
+            player2_state=PlayerState(player_id=2)
+        )
+        arena = ReplayArena.for_replays(1, state.max_frames)
+        recorder = ReplayRecorder()
+        recorder.bind_arena(arena)
+        recorder.start_recording(state)
+        recorder.record_frame(state, 1)
+
+        self.assertGreater(arena.bytes_used, 0)
+        self.assertEqual(len(recorder.frames), 1)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)